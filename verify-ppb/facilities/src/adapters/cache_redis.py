@@ -4,16 +4,106 @@ Provides shared cache across multiple workers/pods
 """
 
 import json
-from typing import Optional, Dict, Any
+import logging
+import functools
+import queue
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, Iterable, List
 from ..core.logger import get_logger
+from .cache_simple import SimpleCache
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - falls back to stdlib json
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional - faster, wire-compatible msgpack codec
+    msgspec = None
+
+try:
+    import msgpack
+except ImportError:  # Optional - falls back to the json serializer
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # Optional - values are stored uncompressed
+    zstandard = None
 
 logger = get_logger(__name__)
 
+# One-byte format markers prepended to every stored value so entries written
+# with another serializer (or before markers existed) remain readable
+FORMAT_JSON = b"\x00"
+FORMAT_MSGPACK = b"\x01"
+
+# Compression flags wrapping the marked payload; values without a flag are
+# read as-is so entries written before compression existed keep working
+COMPRESSED_ZSTD = b"Z"
+COMPRESSED_NONE = b"R"
+ZSTD_LEVEL = 3
+
+# Write-behind queue bound and maximum SET commands per pipeline flush
+WRITE_QUEUE_SIZE = 10000
+WRITE_BATCH_SIZE = 256
+
+# Seconds a get_stats() result is reused so frequent health probes
+# do not reach Redis
+STATS_TTL = 5.0
+
+# SCAN page size and number of keys removed per UNLINK call
+SCAN_COUNT = 1000
+DELETE_CHUNK = 500
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value to UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes returned by Redis"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# MessagePack codec: msgspec's reusable encoder/decoder when installed,
+# otherwise msgpack-python. Both produce the same wire format.
+if msgspec is not None:
+    _packb = msgspec.msgpack.Encoder().encode
+    _unpackb = msgspec.msgpack.Decoder().decode
+elif msgpack is not None:
+    def _packb(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def _unpackb(raw: bytes) -> Any:
+        return msgpack.unpackb(raw, raw=False)
+else:
+    _packb = _unpackb = None
+
 
 class RedisCache:
     """Redis-backed cache for production use"""
 
-    def __init__(self, redis_url: str, default_ttl: int = 3600, key_prefix: str = "ppb:"):
+    def __init__(
+        self,
+        redis_url: str,
+        default_ttl: int = 3600,
+        key_prefix: str = "ppb:",
+        serializer: str = "msgpack",
+        compress_threshold: Optional[int] = 256,
+        max_connections: int = 32,
+        pool_timeout: float = 2.0,
+        write_behind: bool = False,
+        ttl_jitter: float = 0.1,
+    ):
         """
         Initialize Redis cache
 
@@ -21,26 +111,210 @@ class RedisCache:
             redis_url: Redis connection URL
             default_ttl: Default time-to-live in seconds
             key_prefix: Prefix for all cache keys (for namespacing)
+            serializer: Value encoding ('msgpack' or 'json')
+            compress_threshold: zstd-compress payloads larger than this many
+                bytes (None disables compression)
+            max_connections: Connection pool size shared by the worker's threads
+            pool_timeout: Seconds to wait for a free pooled connection
+            write_behind: Queue set() writes and flush them from a
+                background thread instead of waiting for Redis to ACK
+            ttl_jitter: Randomize each TTL by +/- this fraction so keys written
+                together do not all expire together (0 disables)
         """
+        if serializer == "msgpack" and _packb is None:
+            logger.warning("msgpack not installed, falling back to json serializer")
+            serializer = "json"
+
+        if compress_threshold is not None and zstandard is None:
+            logger.warning("zstandard not installed, cache compression disabled")
+            compress_threshold = None
+
+        # zstd contexts are not safe for concurrent use, keep one per thread
+        self._zstd = threading.local()
+
+        # Write-behind worker is started lazily so it lives in the process
+        # that actually serves requests (e.g. after a gunicorn fork)
+        self.write_behind = write_behind
+        self._write_queue: "queue.Queue" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_expires = 0.0
+
         try:
             import redis
-            self.redis = redis.from_url(redis_url, decode_responses=True)
+            from redis.utils import HIREDIS_AVAILABLE
+            # Blocking pool: threads wait for a free connection instead of
+            # opening unbounded extra sockets under load
+            self.pool = redis.BlockingConnectionPool.from_url(
+                redis_url, max_connections=max_connections, timeout=pool_timeout
+            )
+            self.redis = redis.Redis(connection_pool=self.pool)
             self.default_ttl = default_ttl
+            self.ttl_jitter = ttl_jitter
             self.key_prefix = key_prefix
+            # Encoded once so redis-py receives ready-made bytes keys
+            self._key_prefix_b = key_prefix.encode("utf-8")
+            self.serializer = serializer
+            self.compress_threshold = compress_threshold
+
+            # Hot-path lookups resolved once instead of on every call
+            self._redis_get = self.redis.get
+            self._redis_set = self.redis.set
+            if serializer == "msgpack":
+                self._format, self._pack = FORMAT_MSGPACK, _packb
+            else:
+                self._format, self._pack = FORMAT_JSON, _dumps
             
             # Test connection
             self.redis.ping()
-            logger.info(f"RedisCache initialized: url={redis_url}, ttl={default_ttl}s")
+            logger.info(
+                "RedisCache initialized: url=%s, ttl=%ss, serializer=%s, "
+                "compress_threshold=%s, max_connections=%s, write_behind=%s, parser=%s",
+                redis_url, default_ttl, serializer, compress_threshold, max_connections,
+                write_behind, "hiredis" if HIREDIS_AVAILABLE else "python"
+            )
+            if not HIREDIS_AVAILABLE:
+                logger.warning("hiredis not installed, using the pure-Python RESP parser")
         except ImportError:
             logger.error("redis-py not installed. Install with: pip install redis")
             raise
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: %s", e)
             raise
 
-    def _make_key(self, key: str) -> str:
-        """Add prefix to key"""
-        return f"{self.key_prefix}{key}"
+    def _jitter(self, ttl: int) -> int:
+        """Spread a TTL by +/- ttl_jitter to avoid synchronized expiry"""
+        if not self.ttl_jitter:
+            return ttl
+        return max(1, int(ttl * random.uniform(1 - self.ttl_jitter, 1 + self.ttl_jitter)))
+
+    def _write(self, full_key: bytes, ttl: int, blob: bytes) -> None:
+        """SET ... EX now, or hand the write to the background flusher"""
+        ttl = self._jitter(ttl)
+        if self.write_behind:
+            self._ensure_writer()
+            try:
+                self._write_queue.put_nowait((full_key, ttl, blob))
+                return
+            except queue.Full:
+                logger.warning("Cache write queue full, writing synchronously")
+        self._redis_set(full_key, blob, ex=ttl)
+
+    def _ensure_writer(self) -> None:
+        """Start the write-behind thread if it is not running in this process"""
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                if self._writer is not None:
+                    # Forked child: the inherited queue still lists the parent's
+                    # writer as a waiter (so put() would wake nobody), and its
+                    # pending writes are the parent's to send
+                    self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+                self._writer = threading.Thread(
+                    target=self._drain_writes, name="redis-cache-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _drain_writes(self) -> None:
+        """Flush queued writes in pipelined batches; errors are logged only"""
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            writes = [item for item in batch if not isinstance(item, threading.Event)]
+            if writes:
+                try:
+                    pipe = self.redis.pipeline(transaction=False)
+                    for full_key, ttl, blob in writes:
+                        pipe.set(full_key, blob, ex=ttl)
+                    pipe.execute()
+                except Exception as e:
+                    logger.error("Cache write-behind error (%s writes dropped): %s", len(writes), e)
+
+            # Flush markers are released only after everything queued before them
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            for _ in batch:
+                self._write_queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all writes queued so far have been sent to Redis
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue was flushed, False on timeout
+        """
+        if not self.write_behind or self._writer is None:
+            return True
+        # After a fork the inherited writer thread is gone; restart it so the
+        # marker is actually drained instead of waited on forever
+        self._ensure_writer()
+        marker = threading.Event()
+        self._write_queue.put(marker)
+        return marker.wait(timeout)
+
+    def _make_key(self, key: str) -> bytes:
+        """Add prefix to key, returning the bytes sent to Redis"""
+        return self._key_prefix_b + key.encode("utf-8")
+
+    def _serialize(self, value: Any) -> bytes:
+        """Encode a value with the configured serializer and its format marker"""
+        return self._format + self._pack(value)
+
+    def _compressor(self):
+        """Get this thread's reusable zstd compressor"""
+        cctx = getattr(self._zstd, "cctx", None)
+        if cctx is None:
+            cctx = self._zstd.cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        return cctx
+
+    def _decompressor(self):
+        """Get this thread's reusable zstd decompressor"""
+        dctx = getattr(self._zstd, "dctx", None)
+        if dctx is None:
+            dctx = self._zstd.dctx = zstandard.ZstdDecompressor()
+        return dctx
+
+    def _encode(self, value: Any) -> bytes:
+        """Serialize a value and compress it when above the size threshold"""
+        payload = self._serialize(value)
+        if self.compress_threshold is None:
+            return payload
+        if len(payload) > self.compress_threshold:
+            return COMPRESSED_ZSTD + self._compressor().compress(payload)
+        return COMPRESSED_NONE + payload
+
+    def _decode(self, raw: bytes) -> Any:
+        """Decompress (if flagged) and deserialize a stored value"""
+        flag = raw[:1]
+        if flag == COMPRESSED_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard not installed, cannot read compressed entry")
+            return self._deserialize(self._decompressor().decompress(raw[1:]))
+        if flag == COMPRESSED_NONE:
+            return self._deserialize(raw[1:])
+        return self._deserialize(raw)
+
+    def _deserialize(self, raw: bytes) -> Any:
+        """Decode a stored value based on its format marker"""
+        marker = raw[:1]
+        if marker == FORMAT_MSGPACK:
+            return _unpackb(raw[1:])
+        if marker == FORMAT_JSON:
+            return _loads(raw[1:])
+        # Legacy entry written before format markers were introduced
+        return _loads(raw)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -53,17 +327,16 @@ class RedisCache:
             Cached value or None if not found
         """
         try:
-            full_key = self._make_key(key)
-            value = self.redis.get(full_key)
-            
+            value = self._redis_get(self._key_prefix_b + key.encode("utf-8"))
+
             if value is None:
-                logger.debug(f"Cache MISS: {key}")
+                logger.debug("Cache MISS: %s", key)
                 return None
             
-            logger.debug(f"Cache HIT: {key}")
-            return json.loads(value)
+            logger.debug("Cache HIT: %s", key)
+            return self._decode(value)
         except Exception as e:
-            logger.error(f"Cache GET error for {key}: {e}")
+            logger.error("Cache GET error for %s: %s", key, e)
             return None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -76,14 +349,66 @@ class RedisCache:
             ttl: Time-to-live in seconds (uses default if None)
         """
         try:
-            full_key = self._make_key(key)
-            if ttl is None:
-                ttl = self.default_ttl
-            
-            self.redis.setex(full_key, ttl, json.dumps(value))
-            logger.debug(f"Cache SET: {key} (ttl={ttl}s)")
+            ttl = ttl or self.default_ttl
+            self._write(self._key_prefix_b + key.encode("utf-8"), ttl, self._encode(value))
+            logger.debug("Cache SET: %s (ttl=%ss)", key, ttl)
+        except Exception as e:
+            logger.error("Cache SET error for %s: %s", key, e)
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Get several values in a single MGET round-trip
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys, None for misses
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            raw_values = self.redis.mget([self._make_key(k) for k in keys])
+        except Exception as e:
+            logger.error("Cache MGET error for %s keys: %s", len(keys), e)
+            return [None] * len(keys)
+
+        results = []
+        for key, raw in zip(keys, raw_values):
+            if raw is None:
+                results.append(None)
+                continue
+            try:
+                results.append(self._decode(raw))
+            except Exception as e:
+                logger.error("Cache GET error for %s: %s", key, e)
+                results.append(None)
+        if logger.isEnabledFor(logging.DEBUG):
+            hits = sum(r is not None for r in results)
+            logger.debug("Cache MGET: %s/%s hits", hits, len(keys))
+        return results
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Set several values in a single pipelined round-trip
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        if not items:
+            return
+        if ttl is None:
+            ttl = self.default_ttl
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(self._make_key(key), self._encode(value), ex=self._jitter(ttl))
+            pipe.execute()
+            logger.debug("Cache MSET: %s keys (ttl=%ss)", len(items), ttl)
         except Exception as e:
-            logger.error(f"Cache SET error for {key}: {e}")
+            logger.error("Cache MSET error for %s keys: %s", len(items), e)
 
     def delete(self, key: str) -> bool:
         """
@@ -97,51 +422,81 @@ class RedisCache:
         """
         try:
             full_key = self._make_key(key)
-            result = self.redis.delete(full_key)
-            logger.debug(f"Cache DELETE: {key}")
+            result = self.redis.unlink(full_key)
+            logger.debug("Cache DELETE: %s", key)
             return result > 0
         except Exception as e:
-            logger.error(f"Cache DELETE error for {key}: {e}")
+            logger.error("Cache DELETE error for %s: %s", key, e)
             return False
 
+    def _scan_keys(self):
+        """Iterate over prefixed keys with cursor-based SCAN (never KEYS)"""
+        return self.redis.scan_iter(match=self._key_prefix_b + b"*", count=SCAN_COUNT)
+
     def clear(self) -> None:
         """Clear all cache entries with the prefix"""
         try:
-            pattern = f"{self.key_prefix}*"
-            keys = self.redis.keys(pattern)
-            if keys:
-                self.redis.delete(*keys)
-                logger.info(f"Cache CLEARED: {len(keys)} entries removed")
+            removed = 0
+            batch = []
+            for key in self._scan_keys():
+                batch.append(key)
+                if len(batch) >= DELETE_CHUNK:
+                    removed += self.redis.unlink(*batch)
+                    batch = []
+            if batch:
+                removed += self.redis.unlink(*batch)
+            if removed:
+                logger.info("Cache CLEARED: %s entries removed", removed)
         except Exception as e:
-            logger.error(f"Cache CLEAR error: {e}")
+            logger.error("Cache CLEAR error: %s", e)
 
     def get_stats(self) -> Dict[str, Any]:
         """
-        Get cache statistics
+        Get cache statistics (reused for STATS_TTL seconds)
 
         Returns:
-            Dictionary with cache stats
+            Dictionary with cache stats; size is the Redis database's key count
         """
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None and now < self._stats_expires:
+            return dict(cached)
+
         try:
-            info = self.redis.info("stats")
-            pattern = f"{self.key_prefix}*"
-            key_count = len(self.redis.keys(pattern))
-            
-            return {
+            # INFO and DBSIZE in one round-trip; DBSIZE is O(1), unlike
+            # walking the prefix with SCAN
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.info("stats")
+            pipe.dbsize()
+            info, db_size = pipe.execute()
+
+            stats = {
                 "backend": "redis",
-                "size": key_count,
+                "size": db_size,
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
             }
+            self._stats_cache = stats
+            self._stats_expires = now + STATS_TTL
+            return dict(stats)
         except Exception as e:
-            logger.error(f"Cache STATS error: {e}")
+            logger.error("Cache STATS error: %s", e)
             return {"backend": "redis", "error": str(e)}
 
 
+@functools.lru_cache(maxsize=8)
+def _get_redis_cache(frozen_kwargs: frozenset) -> RedisCache:
+    """Build one RedisCache (and connection pool) per distinct configuration"""
+    return RedisCache(**dict(frozen_kwargs))
+
+
 def get_cache(backend: str, **kwargs):
     """
     Factory function to get appropriate cache implementation
 
+    Redis caches are process-wide singletons keyed by their configuration, so
+    repeated calls share one connection pool. Simple caches are always new.
+
     Args:
         backend: Cache backend ('simple' or 'redis')
         **kwargs: Backend-specific configuration
@@ -150,9 +505,5 @@ def get_cache(backend: str, **kwargs):
         Cache instance
     """
     if backend == "redis":
-        from .cache_redis import RedisCache
-        return RedisCache(**kwargs)
-    else:
-        from .cache_simple import SimpleCache
-        return SimpleCache(**kwargs)
-
+        return _get_redis_cache(frozenset(kwargs.items()))
+    return SimpleCache(**kwargs)
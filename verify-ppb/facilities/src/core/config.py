@@ -25,16 +25,36 @@ class Config:
     REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT", "15"))
     MAX_RETRIES = int(os.environ.get("MAX_RETRIES", "2"))
     RETRY_BACKOFF = float(os.environ.get("RETRY_BACKOFF", "0.3"))
+    HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "20"))  # keep-alive connections per host
 
     # Rate Limiting (CRITICAL - prevents IP blocking)
     RATE_LIMIT_DELAY = float(os.environ.get("RATE_LIMIT_DELAY", "1.5"))
+    PPB_BUCKET_CAPACITY = int(os.environ.get("PPB_BUCKET_CAPACITY", "1"))  # burst size
+    PPB_REFILL_RATE = (
+        float(os.environ["PPB_REFILL_RATE"]) if os.environ.get("PPB_REFILL_RATE") else None
+    )  # tokens/second, defaults to 1/RATE_LIMIT_DELAY
+
+    # Admission control: portal verifications allowed in flight per process
+    MAX_CONCURRENT_VERIFICATIONS = int(os.environ.get("MAX_CONCURRENT_VERIFICATIONS", "8"))
+    ADMISSION_TIMEOUT = float(os.environ.get("ADMISSION_TIMEOUT", "5"))  # seconds to wait for a slot
+
+    # Batch verification
+    MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "50"))
+    BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "4"))
 
     # Caching Configuration
     CACHE_ENABLED = os.environ.get("CACHE_ENABLED", "true").lower() == "true"
     CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "simple")  # 'simple' or 'redis'
     CACHE_TTL = int(os.environ.get("CACHE_TTL", "3600"))  # 1 hour default
+    CACHE_TTL_JITTER = float(os.environ.get("CACHE_TTL_JITTER", "0.1"))  # +/- fraction of TTL
+    NEGATIVE_CACHE_TTL = int(os.environ.get("NEGATIVE_CACHE_TTL", "300"))  # "not found" results
     CACHE_MAX_SIZE = int(os.environ.get("CACHE_MAX_SIZE", "1000"))
     REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", "32"))
+    REDIS_POOL_TIMEOUT = float(os.environ.get("REDIS_POOL_TIMEOUT", "2"))
+    CACHE_SERIALIZER = os.environ.get("CACHE_SERIALIZER", "msgpack")  # 'msgpack' or 'json'
+    CACHE_WRITE_BEHIND = os.environ.get("CACHE_WRITE_BEHIND", "false").lower() == "true"
+    CACHE_COMPRESS_THRESHOLD = int(os.environ.get("CACHE_COMPRESS_THRESHOLD", "256"))  # bytes, 0 = always
 
     # Logging Configuration
     LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
@@ -4,13 +4,12 @@ Supports both JSON and text formats with correlation ID tracking
 """
 
 import logging
+import os
 import sys
 import json
-import uuid
 from datetime import datetime
 from typing import Optional
 from contextvars import ContextVar
-from flask import has_request_context, request
 
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
@@ -35,8 +34,11 @@ class JSONFormatter(logging.Formatter):
         if corr_id:
             log_data["correlation_id"] = corr_id
 
-        # Add request context if available
-        if has_request_context():
+        # Add request context if available. Flask is not imported here: if the
+        # application hasn't loaded it, there cannot be a request context
+        flask = sys.modules.get("flask")
+        if flask is not None and flask.has_request_context():
+            request = flask.request
             log_data["request"] = {
                 "method": request.method,
                 "path": request.path,
@@ -115,10 +117,10 @@ def set_correlation_id(corr_id: Optional[str] = None):
     Set correlation ID for request tracking
 
     Args:
-        corr_id: Correlation ID (generates UUID if None)
+        corr_id: Correlation ID (generates a random 128-bit hex ID if None)
     """
     if corr_id is None:
-        corr_id = str(uuid.uuid4())
+        corr_id = os.urandom(16).hex()
     correlation_id.set(corr_id)
     return corr_id
 
@@ -3,14 +3,21 @@ Pydantic models for request/response validation
 Provides automatic validation, serialization, and OpenAPI schema generation
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+# PPB registration number, e.g. PPB/C/9222 - stripped and matched inside
+# pydantic-core instead of a Python-level validator
+PPB_NUMBER_PATTERN = r"^PPB/[A-Za-z0-9]{1,4}/\d{1,8}$"
+PPBNumber = Annotated[
+    str, StringConstraints(strip_whitespace=True, pattern=PPB_NUMBER_PATTERN)
+]
 
 
 class VerifyRequest(BaseModel):
     """Request model for license verification"""
 
-    ppb_number: str = Field(
+    ppb_number: PPBNumber = Field(
         ...,
         min_length=5,
         max_length=50,
@@ -22,11 +29,20 @@ class VerifyRequest(BaseModel):
         description="Whether to use cached results if available",
     )
 
-    @field_validator("ppb_number")
-    @classmethod
-    def normalize_ppb_number(cls, v: str) -> str:
-        """Normalize PPB number by stripping whitespace"""
-        return v.strip()
+
+class VerifyBatchRequest(BaseModel):
+    """Request model for verifying several licenses in one call"""
+
+    ppb_numbers: List[PPBNumber] = Field(
+        ...,
+        min_length=1,
+        description="PPB registration numbers to verify",
+        examples=[["PPB/C/9222", "PPB/G/1387"]],
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use cached results if available",
+    )
 
 
 class SuperintendentData(BaseModel):
@@ -64,6 +80,9 @@ class VerifyResponse(BaseModel):
     message: str = Field(..., description="Human-readable message about the result")
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
     from_cache: bool = Field(..., description="Whether result was served from cache")
+    not_found: bool = Field(
+        False, description="Whether the PPB number is absent from the registry"
+    )
     data: Optional[FacilityData] = Field(
         None, description="Facility data (null if verification failed)"
     )
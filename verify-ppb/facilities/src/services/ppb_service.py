@@ -7,17 +7,171 @@ to ensure 100% compatibility with existing functionality.
 """
 
 import re
+import sys
+import threading
 import time
-from typing import Dict, Optional
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - falls back to response.json()
+    orjson = None
 
 from ..core.config import Config
 from ..core.logger import get_logger
-from ..adapters.http import build_session, RateLimiter
+from ..adapters.http import build_session, AdaptiveRateLimiter
 from ..adapters.cache_redis import get_cache
 
 logger = get_logger(__name__)
 
+# DataTables query for the facilities search, identical on every request
+# except for the search term and cache-busting timestamp, so it is encoded once
+_SEARCH_QUERY_PREFIX = urlencode(
+    [("fetch", "facilities"), ("ftype", ""), ("draw", "1")]
+    + [
+        param
+        for col in range(5)
+        for param in (
+            (f"columns[{col}][data]", str(col)),
+            (f"columns[{col}][name]", ""),
+            (f"columns[{col}][searchable]", "true"),
+            (f"columns[{col}][orderable]", "true"),
+            (f"columns[{col}][search][value]", ""),
+            (f"columns[{col}][search][regex]", "false"),
+        )
+    ]
+    + [
+        ("order[0][column]", "0"), ("order[0][dir]", "asc"),
+        ("start", "0"), ("length", "10"),
+    ]
+)
+
+# Streamed details responses are read in chunks and capped in size
+_DETAILS_CHUNK_SIZE = 8192
+_MAX_DETAILS_BYTES = 2 * 1024 * 1024
+
+# Header variants tried for the details request (primary plus two fallbacks)
+_DETAILS_STRATEGY_COUNT = 3
+
+# Last formatted verified_at timestamp, as (epoch second, ISO string)
+_LAST_TIMESTAMP = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as "%Y-%m-%dT%H:%M:%SZ", formatted at most once per second
+
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _LAST_TIMESTAMP
+    now = int(time.time())
+    second, formatted = _LAST_TIMESTAMP
+    if second != now:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _LAST_TIMESTAMP = (now, formatted)
+    return formatted
+
+
+# Regex patterns compiled once at import and reused for every verification
+
+# Encoded facility ID in the search results' "View Details" link
+_FACILITY_ID_RE = re.compile(r"rel='([^']+)'")
+
+# Markers that must all be present in a valid details response
+_REQUIRED_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Facility Registration Number:',
+        r'License Number:',
+        r'Licence Status:',
+    )
+)
+
+# Basic facility fields extracted from the details HTML
+_FIELD_PATTERNS = {
+    field: re.compile(pattern, re.IGNORECASE)
+    for field, pattern in {
+        'facility_name': r'<b style="font-size:20px;">\s*([^<]+)\s*</b>',
+        'registration_number': r'Facility Registration Number:\s*([^<]+)',
+        'license_number': r'License Number:\s*([^<]+)',
+        'ownership': r'Ownership\s*:\s*([^<]+)',
+        'license_type': r'License Type:\s*([^<]+)',
+        'establishment_year': r'Establishment Year\s*:\s*([^<]+)',
+        'street': r'Street:\s*([^<]+)',
+        'county': r'County\s*:\s*([^<]+)',
+        'license_status': r'Licence Status:\s*([A-Z]+)',
+        'valid_till': r'Valid Till:\s*([\d-]+)'
+    }.items()
+}
+
+_WS_RE = re.compile(r'\s+')
+
+# Label shared by all superintendent extraction tiers
+_SUPERINTENDENT_LABEL_RE = re.compile(r"Superintendent", re.IGNORECASE)
+
+# Superintendent tier 1: the exact commented block. Handles both "Enrollment
+# Number" (Hospital/Retail) and "Registration Number" (Manufacturer/Wholesale)
+_SUPER_PRIMARY_RE = re.compile(
+    r'<!--\s*<a class="list-group-item text-boldest"\s*>\s*Superintendent\s*:\s*([^<]+?)\s*<br\s*\/?>\s*Cadre:\s*([^<]+?)\s*<br\s*\/?>\s*(?:Enrollment Number|Registration Number):\s*([^<]+?)\s*<\/a>\s*-->',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Superintendent tier 2: the three labels anywhere, close together
+_SUPER_FLEXIBLE_RE = re.compile(
+    r'Superintendent\s*:\s*([^\n<]+)[\s\S]{0,200}?Cadre:\s*([^\n<]+)[\s\S]{0,200}?(?:Enrollment Number|Registration Number):\s*([^\n<]+)',
+    re.IGNORECASE
+)
+
+# Tier 2 can only match if a "Cadre:" label follows the superintendent label
+_SUPER_CADRE_LABEL_RE = re.compile(r'Cadre:', re.IGNORECASE)
+
+# Superintendent tier 3: individual labels within the commented section
+_SUPER_NAME_RE = re.compile(r'Superintendent\s*:\s*([^\n<]+)', re.IGNORECASE)
+_SUPER_CADRE_RE = re.compile(r'Cadre:\s*([^\n<]+)', re.IGNORECASE)
+_SUPER_ENROLLMENT_RE = re.compile(r'(?:Enrollment Number|Registration Number):\s*([^\n<]+)', re.IGNORECASE)
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """
+    Milliseconds since a time.perf_counter_ns() reading, to two decimals
+
+    Args:
+        start_ns: Monotonic start time in nanoseconds
+
+    Returns:
+        Elapsed time in milliseconds
+    """
+    return (time.perf_counter_ns() - start_ns) // 10_000 / 100
+
+
+def _find_superintendent_labels(html: str) -> List[int]:
+    """
+    Offsets of every "Superintendent" label, case-insensitively
+
+    ASCII pages (the normal case) are lowercased once and scanned with
+    str.find, which is much cheaper than a case-insensitive regex scan;
+    other pages use the regex so Unicode case folding is unchanged.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        Start offsets in document order
+    """
+    if not html.isascii():
+        return [m.start() for m in _SUPERINTENDENT_LABEL_RE.finditer(html)]
+
+    lowered = html.lower()
+    positions = []
+    pos = lowered.find("superintendent")
+    while pos != -1:
+        positions.append(pos)
+        pos = lowered.find("superintendent", pos + len("superintendent"))
+    return positions
+
 
 class PPBVerificationError(Exception):
     """Base exception for PPB verification errors"""
@@ -29,9 +183,34 @@ class FacilityNotFoundError(PPBVerificationError):
     pass
 
 
+class ServiceBusyError(PPBVerificationError):
+    """Raised when too many verifications are already in flight"""
+    pass
+
+
 class PPBService:
     """PPB license verification service with complete implementation"""
 
+    # Fixed attribute set: no per-instance __dict__ on the hot path
+    __slots__ = (
+        "ppb_base_url",
+        "ppb_search_url",
+        "timeout",
+        "max_retries",
+        "session",
+        "search_headers",
+        "details_headers",
+        "rate_limiter",
+        "_details_race",
+        "_details_executor",
+        "_inflight",
+        "_inflight_lock",
+        "_admission",
+        "use_cache",
+        "cache_ttl",
+        "cache",
+    )
+
     def __init__(
         self,
         ppb_base_url: str = None,
@@ -63,7 +242,8 @@ class PPBService:
         # Session with retry logic
         self.session = build_session(
             max_retries=self.max_retries,
-            backoff=Config.RETRY_BACKOFF
+            backoff=Config.RETRY_BACKOFF,
+            pool_maxsize=Config.HTTP_POOL_MAXSIZE
         )
 
         # Search headers - CRITICAL: Do not modify without testing
@@ -79,7 +259,6 @@ class PPBService:
         self.details_headers = {
             "Accept": "text/html, */*; q=0.01",
             "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
-            "Connection": "keep-alive",
             "Referer": f"{self.ppb_base_url}/LicenseStatus?register=facilities",
             "Sec-Fetch-Dest": "empty",
             "Sec-Fetch-Mode": "cors",
@@ -92,8 +271,29 @@ class PPBService:
         }
 
         # Rate limiter - CRITICAL: Prevents IP blocking
+        # Backs off further when the portal answers 429/503
         delay = rate_limit_delay if rate_limit_delay is not None else Config.RATE_LIMIT_DELAY
-        self.rate_limiter = RateLimiter(delay=delay)
+        self.rate_limiter = AdaptiveRateLimiter(
+            delay=delay,
+            capacity=Config.PPB_BUCKET_CAPACITY,
+            refill_rate=Config.PPB_REFILL_RATE
+        )
+
+        # Set when the primary details strategy last failed; the fallbacks are
+        # then raced in parallel instead of tried one timeout at a time
+        self._details_race = False
+        self._details_executor = ThreadPoolExecutor(
+            max_workers=_DETAILS_STRATEGY_COUNT * Config.MAX_CONCURRENT_VERIFICATIONS,
+            thread_name_prefix="ppb-details"
+        )
+
+        # Single-flight: verifications in progress, keyed by PPB number
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Admission control: caps portal verifications in flight so a burst
+        # queues briefly and is then shed instead of piling onto the limiter
+        self._admission = threading.BoundedSemaphore(Config.MAX_CONCURRENT_VERIFICATIONS)
 
         # Cache setup
         self.use_cache = use_cache and Config.CACHE_ENABLED
@@ -107,7 +307,13 @@ class PPBService:
                     backend="redis",
                     redis_url=Config.REDIS_URL,
                     default_ttl=cache_ttl,
-                    key_prefix="ppb:v1:"
+                    key_prefix="ppb:v1:",
+                    serializer=Config.CACHE_SERIALIZER,
+                    compress_threshold=Config.CACHE_COMPRESS_THRESHOLD,
+                    max_connections=Config.REDIS_MAX_CONNECTIONS,
+                    pool_timeout=Config.REDIS_POOL_TIMEOUT,
+                    write_behind=Config.CACHE_WRITE_BEHIND,
+                    ttl_jitter=Config.CACHE_TTL_JITTER
                 )
             else:
                 self.cache = get_cache(
@@ -124,27 +330,13 @@ class PPBService:
         """Get current timestamp in milliseconds"""
         return str(int(time.time() * 1000))
 
-    def build_search_params(self, search_term: str) -> Dict:
-        """Build parameters for the search request"""
-        return {
-            "fetch": "facilities",
-            "ftype": "",
-            "draw": "1",
-            "columns[0][data]": "0", "columns[0][name]": "", "columns[0][searchable]": "true",
-            "columns[0][orderable]": "true", "columns[0][search][value]": "", "columns[0][search][regex]": "false",
-            "columns[1][data]": "1", "columns[1][name]": "", "columns[1][searchable]": "true",
-            "columns[1][orderable]": "true", "columns[1][search][value]": "", "columns[1][search][regex]": "false",
-            "columns[2][data]": "2", "columns[2][name]": "", "columns[2][searchable]": "true",
-            "columns[2][orderable]": "true", "columns[2][search][value]": "", "columns[2][search][regex]": "false",
-            "columns[3][data]": "3", "columns[3][name]": "", "columns[3][searchable]": "true",
-            "columns[3][orderable]": "true", "columns[3][search][value]": "", "columns[3][search][regex]": "false",
-            "columns[4][data]": "4", "columns[4][name]": "", "columns[4][searchable]": "true",
-            "columns[4][orderable]": "true", "columns[4][search][value]": "", "columns[4][search][regex]": "false",
-            "order[0][column]": "0", "order[0][dir]": "asc",
-            "start": "0", "length": "10",
-            "search[value]": search_term, "search[regex]": "false",
-            "_": self.get_current_timestamp()
-        }
+    def build_search_url(self, search_term: str) -> str:
+        """Build the full search request URL (constant DataTables query + term)"""
+        return (
+            f"{self.ppb_search_url}?{_SEARCH_QUERY_PREFIX}"
+            f"&search%5Bvalue%5D={quote_plus(search_term)}"
+            f"&search%5Bregex%5D=false&_={self.get_current_timestamp()}"
+        )
 
     def search_facilities(self, ppb_number: str) -> Optional[Dict]:
         """
@@ -161,18 +353,20 @@ class PPBService:
         """
         self.rate_limiter.wait()
 
-        params = self.build_search_params(ppb_number)
+        search_url = self.build_search_url(ppb_number)
 
         try:
             logger.debug(f"Searching PPB portal for: {ppb_number}")
             response = self.session.get(
-                self.ppb_search_url,
-                params=params,
+                search_url,
                 headers=self.search_headers,
                 timeout=self.timeout
             )
+            self.rate_limiter.record_response(response.status_code)
             response.raise_for_status()
             logger.debug(f"Search successful for: {ppb_number}")
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
 
         except Exception as e:
@@ -197,7 +391,7 @@ class PPBService:
         # Extract encoded ID from column 4 (View Details link)
         if len(facility_data) > 4 and facility_data[4]:
             view_details_html = str(facility_data[4])
-            id_match = re.search(r"rel='([^']+)'", view_details_html)
+            id_match = _FACILITY_ID_RE.search(view_details_html)
             if id_match:
                 facility_id = id_match.group(1)
                 logger.debug(f"Extracted facility ID: {facility_id}")
@@ -215,18 +409,17 @@ class PPBService:
         Returns:
             True if response is valid, False otherwise
         """
-        required_patterns = [
-            r'Facility Registration Number:',
-            r'License Number:',
-            r'Licence Status:'
-        ]
-        return all(re.search(pattern, html, re.IGNORECASE) for pattern in required_patterns)
+        return all(pattern.search(html) for pattern in _REQUIRED_PATTERNS)
 
     def get_facility_details(self, facility_id: str) -> Optional[str]:
         """
         STEP 2: Get detailed facility information with robust error handling
 
-        Uses multiple fallback strategies to handle potential issues
+        Uses multiple fallback strategies to handle potential issues. They are
+        tried in order, except after the primary strategy has failed: then
+        they are raced, each fallback starting as soon as the rate limiter
+        allows instead of after the previous one times out, and the first
+        valid response wins, until the primary strategy succeeds again.
 
         Args:
             facility_id: Base64-encoded facility ID from search
@@ -248,14 +441,16 @@ class PPBService:
                 self.ppb_search_url,
                 params=params,
                 headers=self.details_headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             ),
             # Fallback 1 - different accept header
             lambda: self.session.get(
                 self.ppb_search_url,
                 params=params,
                 headers={**self.details_headers, "Accept": "*/*"},
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             ),
             # Fallback 2 - minimal headers
             lambda: self.session.get(
@@ -266,26 +461,140 @@ class PPBService:
                     "Referer": self.details_headers["Referer"],
                     "X-Requested-With": "XMLHttpRequest"
                 },
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=True
             ),
         ]
 
+        if self._details_race:
+            html = self._race_details_strategies(strategies)
+            if html is None:
+                logger.error(f"All strategies failed for facility ID: {facility_id}")
+            return html
+
         for idx, strategy in enumerate(strategies):
-            try:
-                logger.debug(f"Fetching details (strategy {idx + 1})")
-                response = strategy()
+            html, throttled = self._try_details_strategy(idx, strategy)
+            if html is not None:
+                return html
+            if idx == 0 and not throttled:
+                self._details_race = True
+            # Every portal request takes its own rate limiter slot
+            if idx < len(strategies) - 1:
+                self.rate_limiter.wait()
+
+        logger.error(f"All strategies failed for facility ID: {facility_id}")
+        return None
+
+    def _try_details_strategy(self, idx: int, strategy) -> Tuple[Optional[str], bool]:
+        """
+        Run one details strategy
+
+        Args:
+            idx: Strategy index (0 is the primary strategy)
+            strategy: Callable issuing the streamed GET request
+
+        Returns:
+            (valid HTML or None, whether the portal throttled the request)
+        """
+        try:
+            logger.debug(f"Fetching details (strategy {idx + 1})")
+            # Streamed so error bodies are never downloaded; the context
+            # manager returns the connection to the pool either way
+            with strategy() as response:
+                self.rate_limiter.record_response(response.status_code)
+                if response.status_code in AdaptiveRateLimiter.THROTTLE_STATUS_CODES:
+                    return None, True
                 if response.status_code == 200:
-                    html = response.text
-                    if self.validate_details_response(html):
+                    html = self._read_details_body(response)
+                    if html and self.validate_details_response(html):
                         logger.debug(f"Details retrieved successfully (strategy {idx + 1})")
-                        return html
-            except Exception as e:
-                logger.warning(f"Strategy {idx + 1} failed: {str(e)}")
-                continue
+                        return html, False
+        except Exception as e:
+            logger.warning(f"Strategy {idx + 1} failed: {str(e)}")
+        return None, False
 
-        logger.error(f"All strategies failed for facility ID: {facility_id}")
+    def _race_details_strategies(self, strategies) -> Optional[str]:
+        """
+        Race the details strategies and return the first valid HTML
+
+        Runs on the shared details executor. The primary strategy uses the
+        rate limiter slot taken by get_facility_details; each fallback waits
+        for its own slot, so the requests are staggered by the limiter and a
+        fallback that has not been sent when another strategy wins is skipped.
+
+        Clears the race flag again once the primary strategy succeeds, or if
+        the portal throttles (so a rate-limited portal is not triple-loaded).
+
+        Args:
+            strategies: Callables issuing the streamed GET requests
+
+        Returns:
+            HTML from the first strategy that succeeded, or None
+        """
+        done = threading.Event()
+        futures = [
+            self._details_executor.submit(self._run_raced_strategy, idx, strategy, done)
+            for idx, strategy in enumerate(strategies)
+        ]
+        # The primary strategy may recover even when a fallback answers first
+        futures[0].add_done_callback(self._on_primary_details_done)
+        # Same worst case as trying the strategies one after another
+        race_timeout = self.timeout * len(strategies)
+        try:
+            for future in as_completed(futures, timeout=race_timeout):
+                html, throttled = future.result()
+                if throttled:
+                    self._details_race = False
+                    done.set()
+                if html is not None:
+                    return html
+        except FuturesTimeoutError:
+            logger.warning(f"No details strategy completed within {race_timeout}s")
+        finally:
+            # Fallbacks still waiting for a slot give up; sent ones finish in the background
+            done.set()
         return None
 
+    def _run_raced_strategy(
+        self, idx: int, strategy, done: threading.Event
+    ) -> Tuple[Optional[str], bool]:
+        """Run one raced details strategy unless the race is already decided"""
+        if idx > 0:
+            if done.is_set():
+                return None, False
+            self.rate_limiter.wait()
+        if done.is_set():
+            return None, False
+        return self._try_details_strategy(idx, strategy)
+
+    def _on_primary_details_done(self, future: Future) -> None:
+        """Return to sequential strategies once the primary one works again"""
+        if not future.cancelled() and future.result()[0] is not None:
+            self._details_race = False
+
+    @staticmethod
+    def _read_details_body(response) -> Optional[str]:
+        """
+        Read a streamed details response into a string with a single decode
+
+        Decodes with the charset requests derived from the headers instead of
+        response.text, which falls back to charset sniffing over the whole
+        body. Bodies larger than _MAX_DETAILS_BYTES are rejected.
+
+        Args:
+            response: Streamed 200 response from the details endpoint
+
+        Returns:
+            Decoded HTML, or None if the body is too large
+        """
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=_DETAILS_CHUNK_SIZE):
+            buf += chunk
+            if len(buf) > _MAX_DETAILS_BYTES:
+                logger.warning(f"Details response exceeds {_MAX_DETAILS_BYTES} bytes, discarding")
+                return None
+        return buf.decode(response.encoding or "utf-8", errors="replace")
+
     def extract_superintendent_from_comments(self, html: str) -> Optional[Dict]:
         """
         Extract superintendent data from HTML comments
@@ -310,58 +619,77 @@ class PPBService:
         Args:
             html: HTML content containing superintendent data
 
+        Cadre values come from a handful of names (PHARMACIST, PHARMTECH, ...)
+        and are interned so repeated results share one string object.
+
         Returns:
             Dictionary with superintendent info or None
         """
         try:
-            # PRIMARY PATTERN - captures the ENTIRE commented superintendent section
-            # Handles both "Enrollment Number" (Hospital/Retail) and "Registration Number" (Manufacturer/Wholesale)
-            comment_pattern = r'<!--\s*<a class="list-group-item text-boldest"\s*>\s*Superintendent\s*:\s*([^<]+?)\s*<br\s*\/?>\s*Cadre:\s*([^<]+?)\s*<br\s*\/?>\s*(?:Enrollment Number|Registration Number):\s*([^<]+?)\s*<\/a>\s*-->'
-
-            match = re.search(comment_pattern, html, re.DOTALL | re.IGNORECASE)
+            # Every tier needs the "Superintendent" label, so locate it once and
+            # point each tier at that region instead of rescanning the document
+            anchors = _find_superintendent_labels(html)
+            if not anchors:
+                logger.warning("Superintendent data not found in HTML")
+                return None
 
-            if match:
-                name = match.group(1).strip()
-                cadre = match.group(2).strip()
-                enrollment = match.group(3).strip()
-
-                logger.debug(f"Superintendent extracted (primary pattern): {name}")
-                return {
-                    "name": name,
-                    "cadre": cadre,
-                    "enrollment_number": enrollment
-                }
+            # PRIMARY PATTERN - captures the ENTIRE commented superintendent section
+            # Tried only at the comment opening each label occurrence sits in
+            for anchor in anchors:
+                comment_start = html.rfind("<!--", 0, anchor)
+                if comment_start == -1 or html.find("-->", comment_start, anchor) != -1:
+                    continue  # label is not inside a comment
+                match = _SUPER_PRIMARY_RE.match(html, comment_start)
+
+                if match:
+                    name = match.group(1).strip()
+                    cadre = sys.intern(match.group(2).strip())
+                    enrollment = match.group(3).strip()
+
+                    logger.debug(f"Superintendent extracted (primary pattern): {name}")
+                    return {
+                        "name": name,
+                        "cadre": cadre,
+                        "enrollment_number": enrollment
+                    }
 
             # FALLBACK PATTERN 1 - More flexible approach
             # Matches superintendent data anywhere in the HTML (not just in comments)
-            alt_pattern = r'Superintendent\s*:\s*([^\n<]+)[\s\S]{0,200}?Cadre:\s*([^\n<]+)[\s\S]{0,200}?(?:Enrollment Number|Registration Number):\s*([^\n<]+)'
-            alt_match = re.search(alt_pattern, html, re.IGNORECASE)
-
-            if alt_match:
-                logger.debug("Superintendent extracted (fallback pattern 1)")
-                return {
-                    "name": alt_match.group(1).strip(),
-                    "cadre": alt_match.group(2).strip(),
-                    "enrollment_number": alt_match.group(3).strip()
-                }
+            # A match can only start at a label occurrence, so it is tried there
+            # only; without any "Cadre:" label after the first one the bounded
+            # gaps would just backtrack to failure, so the tier is skipped
+            if _SUPER_CADRE_LABEL_RE.search(html, anchors[0]):
+                for anchor in anchors:
+                    alt_match = _SUPER_FLEXIBLE_RE.match(html, anchor)
+
+                    if alt_match:
+                        logger.debug("Superintendent extracted (fallback pattern 1)")
+                        return {
+                            "name": alt_match.group(1).strip(),
+                            "cadre": sys.intern(alt_match.group(2).strip()),
+                            "enrollment_number": alt_match.group(3).strip()
+                        }
 
             # FALLBACK PATTERN 2 - Find commented section first, then extract
-            comment_section = r'<!--.*?Superintendent.*?-->'
-            comment_match = re.search(comment_section, html, re.DOTALL | re.IGNORECASE)
+            # Section runs from the first comment opening to the first "-->"
+            # after a label that follows it
+            first_comment = html.find("<!--")
+            label = next((a for a in anchors if a >= first_comment + 4), None)
+            comment_end = html.find("-->", label + len("Superintendent")) if label is not None else -1
 
-            if comment_match:
-                comment_text = comment_match.group(0)
+            if first_comment != -1 and comment_end != -1:
+                comment_text = html[first_comment:comment_end + 3]
 
                 # Now extract from the comment text
-                name_match = re.search(r'Superintendent\s*:\s*([^\n<]+)', comment_text, re.IGNORECASE)
-                cadre_match = re.search(r'Cadre:\s*([^\n<]+)', comment_text, re.IGNORECASE)
-                enrollment_match = re.search(r'(?:Enrollment Number|Registration Number):\s*([^\n<]+)', comment_text, re.IGNORECASE)
+                name_match = _SUPER_NAME_RE.search(comment_text)
+                cadre_match = _SUPER_CADRE_RE.search(comment_text)
+                enrollment_match = _SUPER_ENROLLMENT_RE.search(comment_text)
 
                 if name_match and cadre_match and enrollment_match:
                     logger.debug("Superintendent extracted (fallback pattern 2)")
                     return {
                         "name": name_match.group(1).strip(),
-                        "cadre": cadre_match.group(1).strip(),
+                        "cadre": sys.intern(cadre_match.group(1).strip()),
                         "enrollment_number": enrollment_match.group(1).strip()
                     }
 
@@ -384,27 +712,13 @@ class PPBService:
         """
         info = {}
 
-        # Extraction patterns
-        patterns = {
-            'facility_name': r'<b style="font-size:20px;">\s*([^<]+)\s*</b>',
-            'registration_number': r'Facility Registration Number:\s*([^<]+)',
-            'license_number': r'License Number:\s*([^<]+)',
-            'ownership': r'Ownership\s*:\s*([^<]+)',
-            'license_type': r'License Type:\s*([^<]+)',
-            'establishment_year': r'Establishment Year\s*:\s*([^<]+)',
-            'street': r'Street:\s*([^<]+)',
-            'county': r'County\s*:\s*([^<]+)',
-            'license_status': r'Licence Status:\s*([A-Z]+)',
-            'valid_till': r'Valid Till:\s*([\d-]+)'
-        }
-
         # Extract each field
-        for field, pattern in patterns.items():
-            match = re.search(pattern, html, re.IGNORECASE)
+        for field, pattern in _FIELD_PATTERNS.items():
+            match = pattern.search(html)
             if match:
                 value = match.group(1).strip()
                 # Clean whitespace
-                value = re.sub(r'\s+', ' ', value)
+                value = _WS_RE.sub(' ', value)
                 info[field] = value
                 logger.debug(f"Extracted {field}: {value}")
 
@@ -427,28 +741,90 @@ class PPBService:
             ppb_number: PPB registration number
             use_cache: Whether to use cache
 
+        Concurrent calls for the same PPB number that miss the cache share a
+        single upstream verification (single-flight).
+
         Returns:
             Complete verification result with all fields
+
+        Raises:
+            ServiceBusyError: If no verification slot frees up within
+                Config.ADMISSION_TIMEOUT
+        """
+        start_ns = time.perf_counter_ns()
+
+        if not ppb_number or not isinstance(ppb_number, str):
+            return self._verify_uncached(ppb_number, use_cache, start_ns)
+
+        ppb_number = ppb_number.strip()
+        logger.info(f"Verifying PPB number: {ppb_number}")
+
+        # Check cache
+        if use_cache and self.use_cache:
+            cached_result = self.cache.get(f"detailed:{ppb_number}")
+            if cached_result is not None:
+                logger.info(f"Cache hit for: {ppb_number}")
+                return {
+                    **cached_result,
+                    "from_cache": True,
+                    "processing_time_ms": _elapsed_ms(start_ns)
+                }
+
+            # Recently confirmed "not found" numbers skip the portal entirely
+            negative_result = self.cache.get(f"negative:{ppb_number}")
+            if negative_result is not None:
+                logger.info(f"Negative cache hit for: {ppb_number}")
+                return {
+                    **negative_result,
+                    "from_cache": True,
+                    "processing_time_ms": _elapsed_ms(start_ns)
+                }
+
+        # Join an identical verification already in flight, or lead one
+        with self._inflight_lock:
+            flight = self._inflight.get(ppb_number)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[ppb_number] = Future()
+
+        if not leader:
+            logger.info(f"Joining in-flight verification for: {ppb_number}")
+            return dict(flight.result())
+
+        try:
+            if not self._admission.acquire(timeout=Config.ADMISSION_TIMEOUT):
+                logger.warning(f"Verification rejected, service busy: {ppb_number}")
+                raise ServiceBusyError("Service busy, please retry shortly")
+            try:
+                result = self._verify_uncached(ppb_number, use_cache, start_ns)
+            finally:
+                self._admission.release()
+            flight.set_result(result)
+            return result
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(ppb_number, None)
+
+    def _verify_uncached(self, ppb_number: str, use_cache: bool, start_ns: int) -> Dict:
         """
-        start_time = time.time()
+        Run the portal verification (search, details, parse) for one PPB number
+
+        Args:
+            ppb_number: PPB registration number
+            use_cache: Whether to store the result (or a "not found") in the cache
+            start_ns: time.perf_counter_ns() at which the verification request began
 
+        Returns:
+            Verification result (failures are returned, not raised)
+        """
         try:
             # Validate input
             if not ppb_number or not isinstance(ppb_number, str):
                 raise PPBVerificationError("Invalid PPB number format")
 
-            ppb_number = ppb_number.strip()
-            logger.info(f"Verifying PPB number: {ppb_number}")
-
-            # Check cache
-            cache_key = f"detailed:{ppb_number}"
-            if use_cache and self.use_cache:
-                cached_result = self.cache.get(cache_key)
-                if cached_result is not None:
-                    cached_result['from_cache'] = True
-                    logger.info(f"Cache hit for: {ppb_number}")
-                    return cached_result
-
             # STEP 1: Search for facility
             search_data = self.search_facilities(ppb_number)
 
@@ -474,9 +850,9 @@ class PPBService:
                 raise PPBVerificationError("Failed to extract complete facility information")
 
             # Add metadata
-            detailed_info['verified_at'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+            detailed_info['verified_at'] = _iso_now()
 
-            processing_time = round((time.time() - start_time) * 1000, 2)
+            processing_time = _elapsed_ms(start_ns)
 
             result = {
                 "success": True,
@@ -489,25 +865,32 @@ class PPBService:
 
             # Cache result
             if use_cache and self.use_cache:
-                self.cache.set(cache_key, result, self.cache_ttl)
+                self.cache.set(f"detailed:{ppb_number}", result, self.cache_ttl)
                 logger.debug(f"Cached result for: {ppb_number}")
 
             logger.info(f"Verification successful for {ppb_number} in {processing_time}ms")
             return result
 
         except FacilityNotFoundError as e:
-            processing_time = round((time.time() - start_time) * 1000, 2)
+            processing_time = _elapsed_ms(start_ns)
             logger.warning(f"Facility not found: {ppb_number}")
-            return {
+            result = {
                 "success": False,
                 "ppb_number": ppb_number,
                 "message": str(e),
                 "processing_time_ms": processing_time,
                 "from_cache": False,
+                "not_found": True,
                 "data": None
             }
+
+            # Remember the miss briefly so retries of a mistyped number don't hit PPB
+            if use_cache and self.use_cache:
+                self.cache.set(f"negative:{ppb_number}", dict(result), Config.NEGATIVE_CACHE_TTL)
+
+            return result
         except PPBVerificationError as e:
-            processing_time = round((time.time() - start_time) * 1000, 2)
+            processing_time = _elapsed_ms(start_ns)
             logger.error(f"Verification error for {ppb_number}: {str(e)}")
             return {
                 "success": False,
@@ -518,7 +901,7 @@ class PPBService:
                 "data": None
             }
         except Exception as e:
-            processing_time = round((time.time() - start_time) * 1000, 2)
+            processing_time = _elapsed_ms(start_ns)
             logger.error(f"Unexpected error for {ppb_number}: {str(e)}", exc_info=True)
             return {
                 "success": False,
@@ -529,13 +912,93 @@ class PPBService:
                 "data": None
             }
 
+    def verify_license_detailed_many(self, ppb_numbers: List[str], use_cache: bool = True) -> List[Dict]:
+        """
+        Verify several PPB numbers, fetching cached results in one round-trip
+
+        Cached entries (including recent "not found" results) are read with a
+        single get_many call; only the misses go to the portal (concurrently,
+        still spaced by the shared rate limiter) and are written back with
+        set_many.
+
+        Args:
+            ppb_numbers: PPB registration numbers
+            use_cache: Whether to use cache
+
+        Returns:
+            Verification results in the same order as ppb_numbers
+        """
+        start_ns = time.perf_counter_ns()
+        numbers = [n.strip() if isinstance(n, str) else n for n in ppb_numbers]
+        results: List[Optional[Dict]] = [None] * len(numbers)
+        caching = use_cache and self.use_cache
+
+        if caching:
+            cached = self.cache.get_many(
+                [f"detailed:{n}" for n in numbers] + [f"negative:{n}" for n in numbers]
+            )
+            positive, negative = cached[:len(numbers)], cached[len(numbers):]
+            lookup_ms = _elapsed_ms(start_ns)
+            for idx, cached_result in enumerate(positive):
+                cached_result = cached_result if cached_result is not None else negative[idx]
+                if cached_result is not None:
+                    results[idx] = {
+                        **cached_result,
+                        "from_cache": True,
+                        "processing_time_ms": lookup_ms
+                    }
+
+        # Each distinct miss is fetched once, even if repeated in the batch
+        misses = list(dict.fromkeys(n for n, r in zip(numbers, results) if r is None))
+        if misses:
+            logger.info(f"Batch verification: {len(numbers) - len(misses)} cached, {len(misses)} to fetch")
+            workers = max(1, min(len(misses), Config.BATCH_MAX_WORKERS))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ppb-batch") as executor:
+                fetched = dict(zip(
+                    misses,
+                    executor.map(self._verify_batch_entry, misses)
+                ))
+
+            if caching:
+                to_cache = {
+                    f"detailed:{n}": result for n, result in fetched.items() if result.get("success")
+                }
+                if to_cache:
+                    self.cache.set_many(to_cache, self.cache_ttl)
+
+                not_found = {
+                    f"negative:{n}": result for n, result in fetched.items() if result.get("not_found")
+                }
+                if not_found:
+                    self.cache.set_many(not_found, Config.NEGATIVE_CACHE_TTL)
+
+            results = [r if r is not None else fetched[n] for n, r in zip(numbers, results)]
+
+        return results
+
+    def _verify_batch_entry(self, ppb_number: str) -> Dict:
+        """Verify one batch miss, reporting a busy service as a failed result"""
+        start_ns = time.perf_counter_ns()
+        try:
+            return self.verify_license_detailed(ppb_number, use_cache=False)
+        except ServiceBusyError as e:
+            return {
+                "success": False,
+                "ppb_number": ppb_number,
+                "message": str(e),
+                "processing_time_ms": _elapsed_ms(start_ns),
+                "from_cache": False,
+                "data": None
+            }
+
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
         if not self.use_cache or self.cache is None:
-            return {"cache_enabled": False}
+            return {"cache_enabled": False, **self.rate_limiter.get_stats()}
 
         stats = self.cache.get_stats()
         stats['cache_enabled'] = True
+        stats.update(self.rate_limiter.get_stats())
         return stats
 
     def clear_cache(self) -> bool:
@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures for the offline tests
+
+The script-style tests (test_direct.py, test_verification.py,
+test_superintendent_fix.py) do not use these.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.ppb_service import PPBService
+
+# Answered by the fake portal as "no facility found"
+UNKNOWN_PPB_NUMBER = "PPB/X/0000"
+
+
+@pytest.fixture
+def fake_portal(monkeypatch):
+    """
+    Replace the PPB portal steps of PPBService with an in-memory fake
+
+    Returns a namespace with `searches` (PPB numbers searched, in order) and
+    `gate`, an Event every search waits on (set by default; clear it to hold
+    searches in flight).
+    """
+    portal = SimpleNamespace(searches=[], lock=threading.Lock(), gate=threading.Event())
+    portal.gate.set()
+
+    def search_facilities(self, ppb_number):
+        with portal.lock:
+            portal.searches.append(ppb_number)
+        portal.gate.wait(5)
+        if ppb_number == UNKNOWN_PPB_NUMBER:
+            return {"data": []}
+        return {"data": [[ppb_number]]}
+
+    monkeypatch.setattr(PPBService, "search_facilities", search_facilities)
+    monkeypatch.setattr(PPBService, "extract_facility_id", lambda self, data: data["data"][0][0])
+    monkeypatch.setattr(PPBService, "get_facility_details", lambda self, facility_id: facility_id)
+    monkeypatch.setattr(PPBService, "parse_detailed_html", lambda self, html: {"license_number": html})
+    return portal
+
+
+@pytest.fixture
+def cached_service(fake_portal):
+    """Service on the fake portal with an in-memory cache and no rate limit delay"""
+    return PPBService(use_cache=True, cache_backend="simple", cache_ttl=300, rate_limit_delay=0)
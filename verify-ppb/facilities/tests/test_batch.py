@@ -0,0 +1,90 @@
+"""
+Batch verification and single-flight tests (no PPB portal access needed)
+
+Run with: python -m pytest tests/test_batch.py
+"""
+
+import threading
+import time
+
+import pytest
+
+from tests.conftest import UNKNOWN_PPB_NUMBER
+
+
+@pytest.mark.unit
+class TestBatchCacheLookup:
+    """The single MGET over detailed: and negative: keys"""
+
+    def test_detailed_entry_wins_over_negative(self, cached_service, fake_portal):
+        cached_service.cache.set("detailed:PPB/C/1", {"success": True, "ppb_number": "PPB/C/1"})
+        cached_service.cache.set("negative:PPB/C/1", {"success": False, "ppb_number": "PPB/C/1"})
+
+        results = cached_service.verify_license_detailed_many(["PPB/C/1"])
+
+        assert results[0]["success"] is True
+        assert results[0]["from_cache"] is True
+        assert fake_portal.searches == []
+
+    def test_hits_and_misses_merged_in_request_order(self, cached_service, fake_portal):
+        cached_service.cache.set("detailed:PPB/C/2", {"success": True, "ppb_number": "PPB/C/2"})
+        cached_service.cache.set(
+            f"negative:{UNKNOWN_PPB_NUMBER}",
+            {"success": False, "ppb_number": UNKNOWN_PPB_NUMBER, "not_found": True}
+        )
+
+        numbers = [UNKNOWN_PPB_NUMBER, "PPB/C/1", "PPB/C/2", "PPB/C/1"]
+
+        results = cached_service.verify_license_detailed_many(numbers)
+
+        assert [r["ppb_number"] for r in results] == numbers
+        assert [r["from_cache"] for r in results] == [True, False, True, False]
+        assert fake_portal.searches == ["PPB/C/1"]
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Concurrent verifications of one PPB number share a portal round trip"""
+
+    def test_concurrent_callers_join_the_leader(self, cached_service, fake_portal):
+        fake_portal.gate.clear()
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    cached_service.verify_license_detailed("PPB/C/1", use_cache=False)
+                )
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        # Let every caller reach the in-flight check before the leader finishes
+        time.sleep(0.2)
+        fake_portal.gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert fake_portal.searches == ["PPB/C/1"]
+        assert len(results) == 3
+        assert all(r["success"] for r in results)
+
+
+@pytest.mark.unit
+class TestBatchBusy:
+    """A miss that gets no verification slot fails on its own"""
+
+    def test_busy_miss_does_not_fail_the_batch(self, cached_service, fake_portal, monkeypatch):
+        cached_service.cache.set("detailed:PPB/C/1", {"success": True, "ppb_number": "PPB/C/1"})
+        monkeypatch.setattr(cached_service, "_admission", threading.BoundedSemaphore(1))
+        cached_service._admission.acquire()
+        monkeypatch.setattr("src.services.ppb_service.Config.ADMISSION_TIMEOUT", 0.01)
+
+        results = cached_service.verify_license_detailed_many(["PPB/C/1", "PPB/C/2"])
+
+        assert results[0]["success"] is True
+        assert results[1]["success"] is False
+        assert "busy" in results[1]["message"].lower()
+        assert fake_portal.searches == []
+        # Busy is not "not found", so nothing is negative-cached
+        assert cached_service.cache.get("negative:PPB/C/2") is None
@@ -4,52 +4,89 @@ Test script specifically for superintendent extraction fix
 Tests the corrected regex patterns with known HTML structures
 """
 
+import functools
 import re
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+# Patterns compiled once at import instead of on every extraction call
+
+# Primary pattern - captures the ENTIRE commented superintendent section
+_SUPER_COMMENT_RE = re.compile(
+    r'<!--\s*<a class="list-group-item text-boldest"\s*>\s*Superintendent\s*:\s*(?P<name>[^<]+?)\s*<br\s*\/?>\s*Cadre:\s*(?P<cadre>[^<]+?)\s*<br\s*\/?>\s*Enrollment Number:\s*(?P<enroll>[^<]+?)\s*<\/a>\s*-->',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Fallback 1 - the three labels anywhere, close together
+_SUPER_ALT_RE = re.compile(
+    r'Superintendent\s*:\s*(?P<name>[^\n<]+)[\s\S]{0,200}?Cadre:\s*(?P<cadre>[^\n<]+)[\s\S]{0,200}?Enrollment Number:\s*(?P<enroll>[^\n<]+)',
+    re.IGNORECASE
+)
+
+# Fallback 2 - the commented section, then each label within it
+_SUPER_COMMENT_SECTION_RE = re.compile(r'<!--.*?Superintendent.*?-->', re.DOTALL | re.IGNORECASE)
+_SUPER_LABEL_RE = re.compile(r'Superintendent', re.IGNORECASE)
+_SUPER_NAME_RE = re.compile(r'Superintendent\s*:\s*([^\n<]+)', re.IGNORECASE)
+_SUPER_CADRE_RE = re.compile(r'Cadre:\s*([^\n<]+)', re.IGNORECASE)
+_SUPER_ENROLL_RE = re.compile(r'Enrollment Number:\s*([^\n<]+)', re.IGNORECASE)
+
 
 def extract_superintendent_from_comments(html: str) -> Optional[Dict]:
     """
     Extract superintendent data from HTML comments - CORRECTED VERSION
+
+    Results are memoized per HTML string; each call gets its own dict.
     """
-    try:
-        # Primary pattern - captures the ENTIRE commented superintendent section
-        comment_pattern = r'<!--\s*<a class="list-group-item text-boldest"\s*>\s*Superintendent\s*:\s*([^<]+?)\s*<br\s*\/?>\s*Cadre:\s*([^<]+?)\s*<br\s*\/?>\s*Enrollment Number:\s*([^<]+?)\s*<\/a>\s*-->'
+    if not isinstance(html, str):
+        return _extract_superintendent(html)
+    items = _extract_cached(html)
+    return dict(items) if items is not None else None
 
-        match = re.search(comment_pattern, html, re.DOTALL | re.IGNORECASE)
 
-        if match:
-            name = match.group(1).strip()
-            cadre = match.group(2).strip()
-            enrollment = match.group(3).strip()
+@functools.lru_cache(maxsize=1024)
+def _extract_cached(html: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """Memoized extraction, stored as an immutable tuple of items"""
+    result = _extract_superintendent(html)
+    return tuple(result.items()) if result is not None else None
 
-            return {
-                "name": name,
-                "cadre": cadre,
-                "enrollment_number": enrollment
-            }
+
+def _extract_superintendent(html: str) -> Optional[Dict]:
+    """Run the three extraction tiers on html"""
+    try:
+        # Every pattern needs the labels, so check for them with plain substring
+        # scans first (ASCII only, where lowercasing matches IGNORECASE exactly)
+        lowered = html.lower() if html.isascii() else None
+        if lowered is not None and "superintendent" not in lowered:
+            return None
+
+        # Primary pattern - captures the ENTIRE commented superintendent section
+        match = _SUPER_COMMENT_RE.search(html)
 
         # FALLBACK PATTERN 1 - More flexible approach
-        alt_pattern = r'Superintendent\s*:\s*([^\n<]+)[\s\S]{0,200}?Cadre:\s*([^\n<]+)[\s\S]{0,200}?Enrollment Number:\s*([^\n<]+)'
-        alt_match = re.search(alt_pattern, html, re.IGNORECASE)
+        if not match and (lowered is None or ("cadre:" in lowered and "enrollment number:" in lowered)):
+            match = _SUPER_ALT_RE.search(html)
 
-        if alt_match:
+        if match:
             return {
-                "name": alt_match.group(1).strip(),
-                "cadre": alt_match.group(2).strip(),
-                "enrollment_number": alt_match.group(3).strip()
+                "name": match["name"].strip(),
+                "cadre": match["cadre"].strip(),
+                "enrollment_number": match["enroll"].strip()
             }
 
         # FALLBACK PATTERN 2 - Find commented section first, then extract
-        comment_section = r'<!--.*?Superintendent.*?-->'
-        comment_match = re.search(comment_section, html, re.DOTALL | re.IGNORECASE)
+        # Same span as _SUPER_COMMENT_SECTION_RE (first "<!--", then the first
+        # "-->" after a label following it) found with plain scans instead of
+        # a DOTALL lazy match over the whole document
+        comment_start = html.find("<!--")
+        label = _SUPER_LABEL_RE.search(html, comment_start + 4) if comment_start != -1 else None
+        comment_end = html.find("-->", label.end()) if label else -1
 
-        if comment_match:
-            comment_text = comment_match.group(0)
+        if comment_end != -1:
+            comment_text = html[comment_start:comment_end + 3]
 
             # Now extract from the comment text
-            name_match = re.search(r'Superintendent\s*:\s*([^\n<]+)', comment_text, re.IGNORECASE)
-            cadre_match = re.search(r'Cadre:\s*([^\n<]+)', comment_text, re.IGNORECASE)
-            enrollment_match = re.search(r'Enrollment Number:\s*([^\n<]+)', comment_text, re.IGNORECASE)
+            name_match = _SUPER_NAME_RE.search(comment_text)
+            cadre_match = _SUPER_CADRE_RE.search(comment_text)
+            enrollment_match = _SUPER_ENROLL_RE.search(comment_text)
 
             if name_match and cadre_match and enrollment_match:
                 return {
@@ -211,8 +248,7 @@ def debug_superintendent_extraction(html_content: str):
     print(f"Has HTML comments: {'✅' if has_comments else '❌'}")
 
     # Find all comments containing superintendent
-    comment_pattern = r'<!--.*?Superintendent.*?-->'
-    comments = re.findall(comment_pattern, html_content, re.DOTALL | re.IGNORECASE)
+    comments = _SUPER_COMMENT_SECTION_RE.findall(html_content)
 
     print(f"Found {len(comments)} superintendent comment(s)")
 
@@ -230,8 +266,7 @@ def debug_superintendent_extraction(html_content: str):
             print("❌ Extraction failed from this comment")
 
     # Try the flexible fallback pattern on entire content
-    fallback_pattern = r'Superintendent\s*:\s*([^\n<]+)[\s\S]{0,200}?Cadre:\s*([^\n<]+)[\s\S]{0,200}?Enrollment Number:\s*([^\n<]+)'
-    fallback_match = re.search(fallback_pattern, html_content, re.IGNORECASE)
+    fallback_match = _SUPER_ALT_RE.search(html_content)
 
     print(f"\nFallback pattern match: {'✅' if fallback_match else '❌'}")
 
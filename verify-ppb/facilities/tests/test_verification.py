@@ -3,13 +3,32 @@ Test script for PPB verification service V4
 Tests the complete two-step workflow with proper session and headers
 """
 
-import urllib.request
-import urllib.parse
 import json
+import os
+import sys
 import time
 
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    dumps, loads = orjson.dumps, orjson.loads
+except ImportError:  # Optional speedup - falls back to stdlib json
+    dumps, loads = json.dumps, json.loads
+
 BASE_URL = "http://localhost:5000"
 
+# One keep-alive session shared by the health probe and every test case
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# PPB_TEST_QUIET=1 prints only the final summary; PPB_TEST_DELAY adds a pause
+# (seconds) between cases - the service applies its own portal rate limit
+QUIET = os.environ.get("PPB_TEST_QUIET") == "1"
+TEST_DELAY = float(os.environ.get("PPB_TEST_DELAY", "0"))
+
 TEST_CASES = [
     "PPB/C/9222",
     "PPB/G/1387",
@@ -31,9 +50,20 @@ REQUIRED_FIELDS = [
 
 def test_verify(ppb_number):
     """Test the /verify endpoint"""
-    print(f"\n{'='*70}")
-    print(f"Testing: {ppb_number}")
-    print(f"{'='*70}")
+    # Output is collected and written once per case (or not at all if QUIET)
+    out = []
+    try:
+        return _verify_case(ppb_number, out)
+    finally:
+        if not QUIET:
+            sys.stdout.write("\n".join(out) + "\n")
+
+
+def _verify_case(ppb_number, out):
+    """Run one /verify case, appending its report lines to out"""
+    out.append(f"\n{'='*70}")
+    out.append(f"Testing: {ppb_number}")
+    out.append(f"{'='*70}")
 
     url = f"{BASE_URL}/verify"
     payload = {
@@ -41,31 +71,33 @@ def test_verify(ppb_number):
         "use_cache": False
     }
 
-    headers = {
-        "Content-Type": "application/json"
-    }
-
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(url, data=data, headers=headers, method='POST')
+        response = SESSION.post(url, data=dumps(payload), timeout=30)
+
+        if response.status_code >= 400:
+            out.append(f"\n❌ HTTP Error: {response.status_code}")
+            try:
+                out.append(f"  Message: {loads(response.content).get('message')}")
+            except:
+                pass
+            return False
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode())
+        result = loads(response.content)
 
         # Display results
-        print(f"\nResponse:")
-        print(f"  Success: {result.get('success')}")
-        print(f"  Message: {result.get('message')}")
-        print(f"  Processing Time: {result.get('processing_time_ms')} ms")
+        out.append(f"\nResponse:")
+        out.append(f"  Success: {result.get('success')}")
+        out.append(f"  Message: {result.get('message')}")
+        out.append(f"  Processing Time: {result.get('processing_time_ms')} ms")
 
         if not result.get('success'):
-            print(f"\n❌ FAILED: {result.get('message')}")
+            out.append(f"\n❌ FAILED: {result.get('message')}")
             return False
 
         data_obj = result.get('data', {})
 
         # Check required fields
-        print(f"\nFields Extracted:")
+        out.append(f"\nFields Extracted:")
         found = 0
         missing = []
 
@@ -74,52 +106,43 @@ def test_verify(ppb_number):
             if value:
                 found += 1
                 display_value = str(value)[:40]
-                print(f"  ✅ {field}: {display_value}")
+                out.append(f"  ✅ {field}: {display_value}")
             else:
                 missing.append(field)
-                print(f"  ❌ {field}: MISSING")
+                out.append(f"  ❌ {field}: MISSING")
 
         # Check superintendent
         superintendent = data_obj.get('superintendent')
-        print(f"\nSuperintendent:")
+        out.append(f"\nSuperintendent:")
         if superintendent:
-            print(f"  ✅ name: {superintendent.get('name', 'N/A')}")
-            print(f"  ✅ cadre: {superintendent.get('cadre', 'N/A')}")
-            print(f"  ✅ enrollment_number: {superintendent.get('enrollment_number', 'N/A')}")
+            out.append(f"  ✅ name: {superintendent.get('name', 'N/A')}")
+            out.append(f"  ✅ cadre: {superintendent.get('cadre', 'N/A')}")
+            out.append(f"  ✅ enrollment_number: {superintendent.get('enrollment_number', 'N/A')}")
             found += 3
         else:
-            print(f"  ❌ MISSING")
+            out.append(f"  ❌ MISSING")
             missing.extend(['superintendent.name', 'superintendent.cadre', 'superintendent.enrollment_number'])
 
         # Summary
         total = len(REQUIRED_FIELDS) + 3
-        print(f"\nSummary:")
-        print(f"  Fields found: {found}/{total}")
-        print(f"  Fields missing: {len(missing)}")
+        out.append(f"\nSummary:")
+        out.append(f"  Fields found: {found}/{total}")
+        out.append(f"  Fields missing: {len(missing)}")
 
         if found == total:
-            print(f"\n🎉 SUCCESS: All {total} fields extracted!")
+            out.append(f"\n🎉 SUCCESS: All {total} fields extracted!")
             return True
         elif found >= len(REQUIRED_FIELDS):
-            print(f"\n⚠️  PARTIAL: Required fields found, missing superintendent")
+            out.append(f"\n⚠️  PARTIAL: Required fields found, missing superintendent")
             return True
         else:
-            print(f"\n❌ INCOMPLETE: Missing {len(missing)} fields")
+            out.append(f"\n❌ INCOMPLETE: Missing {len(missing)} fields")
             if missing:
-                print(f"  Missing: {', '.join(missing)}")
+                out.append(f"  Missing: {', '.join(missing)}")
             return False
 
-    except urllib.error.HTTPError as e:
-        print(f"\n❌ HTTP Error: {e.code}")
-        try:
-            error_body = e.read().decode()
-            error_data = json.loads(error_body)
-            print(f"  Message: {error_data.get('message')}")
-        except:
-            pass
-        return False
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        out.append(f"\n❌ Error: {e}")
         return False
 
 def main():
@@ -129,10 +152,10 @@ def main():
 
     # Check server
     try:
-        health_req = urllib.request.Request(f"{BASE_URL}/health")
-        with urllib.request.urlopen(health_req, timeout=5) as response:
-            health = json.loads(response.read().decode())
-            print(f"\n✅ Server running (version: {health.get('version')})")
+        response = SESSION.get(f"{BASE_URL}/health", timeout=5)
+        response.raise_for_status()
+        health = response.json()
+        print(f"\n✅ Server running (version: {health.get('version')})")
     except Exception as e:
         print(f"\n❌ Server not reachable at {BASE_URL}")
         print(f"  Please start with: python app.py")
@@ -141,12 +164,14 @@ def main():
     # Run tests
     results = []
     for i, ppb_number in enumerate(TEST_CASES, 1):
-        print(f"\n[Test {i}/{len(TEST_CASES)}]")
+        if not QUIET:
+            print(f"\n[Test {i}/{len(TEST_CASES)}]")
         success = test_verify(ppb_number)
         results.append(success)
-        if i < len(TEST_CASES):
-            print(f"\n⏱️  Waiting 2 seconds...")
-            time.sleep(2)
+        if i < len(TEST_CASES) and TEST_DELAY > 0:
+            if not QUIET:
+                print(f"\n⏱️  Waiting {TEST_DELAY:g} seconds...")
+            time.sleep(TEST_DELAY)
 
     # Final summary
     print(f"\n{'='*70}")
@@ -9,11 +9,19 @@ backlog = 2048
 
 # Worker processes
 workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
-worker_class = 'sync'
+# Threaded workers: a verification spends nearly all its time waiting on the
+# PPB portal, so each worker serves several requests concurrently while its
+# shared PPBService keeps the rate limit and connection pool per process
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
 worker_connections = 1000
 timeout = 30
 keepalive = 2
 
+# Import the app once in the master; each worker then builds its own
+# PPBService in post_fork below and reuses it for every request it serves
+preload_app = True
+
 # Logging
 accesslog = '-'  # Log to stdout
 errorlog = '-'   # Log to stderr
@@ -34,3 +42,13 @@ tmp_upload_dir = None
 # SSL (if needed)
 # keyfile = '/path/to/keyfile'
 # certfile = '/path/to/certfile'
+
+
+def post_fork(server, worker):
+    """Give each worker its own PPB session, rate limiter and cache"""
+    # The service built while preloading holds sockets and locks that must
+    # not be shared across processes, so it is replaced once per worker
+    from src.api.routes import init_service
+    from src.app import app
+
+    init_service(app)
@@ -4,12 +4,31 @@ Provides shared cache across multiple workers/pods
 """
 
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from ..core.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - falls back to stdlib json
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value to UTF-8 JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes returned by Redis"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class RedisCache:
     """Redis-backed cache for production use"""
 
@@ -24,7 +43,8 @@ class RedisCache:
         """
         try:
             import redis
-            self.redis = redis.from_url(redis_url, decode_responses=True)
+            # Values are JSON bytes, decoded by _loads rather than by redis-py
+            self.redis = redis.from_url(redis_url)
             self.default_ttl = default_ttl
             self.key_prefix = key_prefix
 
@@ -61,7 +81,7 @@ class RedisCache:
                 return None
 
             logger.debug(f"Cache HIT: {key}")
-            return json.loads(value)
+            return _loads(value)
         except Exception as e:
             logger.error(f"Cache GET error for {key}: {e}")
             return None
@@ -80,11 +100,64 @@ class RedisCache:
             if ttl is None:
                 ttl = self.default_ttl
 
-            self.redis.setex(full_key, ttl, json.dumps(value))
+            self.redis.setex(full_key, ttl, _dumps(value))
             logger.debug(f"Cache SET: {key} (ttl={ttl}s)")
         except Exception as e:
             logger.error(f"Cache SET error for {key}: {e}")
 
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Get several values in a single MGET round-trip
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys, None for misses
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            raw_values = self.redis.mget([self._make_key(k) for k in keys])
+        except Exception as e:
+            logger.error(f"Cache MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+        results = []
+        for key, raw in zip(keys, raw_values):
+            if raw is None:
+                results.append(None)
+                continue
+            try:
+                results.append(_loads(raw))
+            except Exception as e:
+                logger.error(f"Cache GET error for {key}: {e}")
+                results.append(None)
+        logger.debug(f"Cache MGET: {sum(r is not None for r in results)}/{len(keys)} hits")
+        return results
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Set several values in a single pipelined round-trip
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        if not items:
+            return
+        if ttl is None:
+            ttl = self.default_ttl
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(self._make_key(key), ttl, _dumps(value))
+            pipe.execute()
+            logger.debug(f"Cache MSET: {len(items)} keys (ttl={ttl}s)")
+        except Exception as e:
+            logger.error(f"Cache MSET error for {len(items)} keys: {e}")
+
     def delete(self, key: str) -> bool:
         """
         Delete key from cache
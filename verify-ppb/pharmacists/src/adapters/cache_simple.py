@@ -1,39 +1,98 @@
 """
 Simple in-memory cache implementation
-Thread-safe cache with TTL and LRU eviction
+Thread-safe cache with TTL and LRU eviction, sharded to reduce lock contention
+Expiry times are on the monotonic clock, so wall-clock steps don't affect TTLs
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from collections import OrderedDict
 import threading
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of independently locked shards (power of two so hash & mask selects one)
+NUM_SHARDS = 16
+
+
+class _Shard:
+    """One LRU partition of the cache with its own lock and counters"""
+
+    __slots__ = ("cache", "lock", "max_size", "hits", "misses", "sets", "evictions")
+
+    def __init__(self, max_size: int):
+        self.cache: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+
+    def get(self, key: str, current_time: float) -> Optional[Any]:
+        """Get a live value (caller holds the lock)"""
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        # Check if expired
+        value, expires_at = entry
+        if current_time > expires_at:
+            del self.cache[key]
+            self.misses += 1
+            return None
+
+        # Move to end (LRU)
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int, current_time: float) -> None:
+        """Store a value, evicting the shard's oldest entry if full (caller holds the lock)"""
+        if key not in self.cache and len(self.cache) >= self.max_size:
+            evicted_key = self.cache.popitem(last=False)[0]
+            self.evictions += 1
+            logger.debug(f"Cache EVICTED: {evicted_key}")
+
+        # Entries are (value, expires_at) tuples
+        self.cache[key] = (value, current_time + ttl)
+
+        # Move to end (most recently used)
+        self.cache.move_to_end(key)
+        self.sets += 1
+
 
 class SimpleCache:
     """Thread-safe in-memory cache with TTL and LRU eviction"""
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
+    def __init__(self, max_size: int = 1000, default_ttl: int = 3600, num_shards: int = NUM_SHARDS):
         """
         Initialize cache
 
+        Keys are spread over num_shards partitions, each with its own lock,
+        so concurrent requests rarely wait on each other. LRU eviction is per
+        shard.
+
         Args:
             max_size: Maximum number of entries
             default_ttl: Default time-to-live in seconds
+            num_shards: Number of shards (rounded up to a power of two)
         """
+        num_shards = 1 << max(0, num_shards - 1).bit_length()
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.cache: OrderedDict = OrderedDict()
-        self.lock = threading.Lock()
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "sets": 0,
-            "evictions": 0,
-        }
-        logger.info(f"SimpleCache initialized: max_size={max_size}, ttl={default_ttl}s")
+        self._mask = num_shards - 1
+        shard_size = max(1, -(-max_size // num_shards))
+        self._shards = [_Shard(shard_size) for _ in range(num_shards)]
+        logger.info(
+            f"SimpleCache initialized: max_size={max_size}, ttl={default_ttl}s, shards={num_shards}"
+        )
+
+    def _shard(self, key: str) -> _Shard:
+        """Select the shard owning key"""
+        return self._shards[hash(key) & self._mask]
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -45,27 +104,11 @@ class SimpleCache:
         Returns:
             Cached value or None if not found/expired
         """
-        with self.lock:
-            if key not in self.cache:
-                self.stats["misses"] += 1
-                logger.debug(f"Cache MISS: {key}")
-                return None
-
-            entry = self.cache[key]
-            current_time = time.time()
-
-            # Check if expired
-            if current_time > entry["expires_at"]:
-                del self.cache[key]
-                self.stats["misses"] += 1
-                logger.debug(f"Cache MISS (expired): {key}")
-                return None
-
-            # Move to end (LRU)
-            self.cache.move_to_end(key)
-            self.stats["hits"] += 1
-            logger.debug(f"Cache HIT: {key}")
-            return entry["value"]
+        shard = self._shard(key)
+        with shard.lock:
+            value = shard.get(key, time.monotonic())
+        logger.debug(f"Cache {'HIT' if value is not None else 'MISS'}: {key}")
+        return value
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -76,26 +119,59 @@ class SimpleCache:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
         """
-        with self.lock:
-            if ttl is None:
-                ttl = self.default_ttl
+        if ttl is None:
+            ttl = self.default_ttl
+
+        shard = self._shard(key)
+        with shard.lock:
+            shard.set(key, value, ttl, time.monotonic())
+        logger.debug(f"Cache SET: {key} (ttl={ttl}s)")
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Get several values, locking each shard once
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys, None for misses/expired
+        """
+        keys = list(keys)
+        results: List[Optional[Any]] = [None] * len(keys)
+        by_shard: Dict[int, List[int]] = {}
+        for idx, key in enumerate(keys):
+            by_shard.setdefault(hash(key) & self._mask, []).append(idx)
+
+        current_time = time.monotonic()
+        for shard_idx, indexes in by_shard.items():
+            shard = self._shards[shard_idx]
+            with shard.lock:
+                for idx in indexes:
+                    results[idx] = shard.get(keys[idx], current_time)
+        return results
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Set several values, locking each shard once
 
-            # Evict oldest if at capacity
-            if key not in self.cache and len(self.cache) >= self.max_size:
-                evicted_key = self.cache.popitem(last=False)[0]
-                self.stats["evictions"] += 1
-                logger.debug(f"Cache EVICTED: {evicted_key}")
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        if ttl is None:
+            ttl = self.default_ttl
 
-            self.cache[key] = {
-                "value": value,
-                "expires_at": time.time() + ttl,
-                "created_at": time.time(),
-            }
+        by_shard: Dict[int, List[str]] = {}
+        for key in items:
+            by_shard.setdefault(hash(key) & self._mask, []).append(key)
 
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            self.stats["sets"] += 1
-            logger.debug(f"Cache SET: {key} (ttl={ttl}s)")
+        current_time = time.monotonic()
+        for shard_idx, keys in by_shard.items():
+            shard = self._shards[shard_idx]
+            with shard.lock:
+                for key in keys:
+                    shard.set(key, items[key], ttl, current_time)
 
     def delete(self, key: str) -> bool:
         """
@@ -107,42 +183,56 @@ class SimpleCache:
         Returns:
             True if key was deleted, False if not found
         """
-        with self.lock:
-            if key in self.cache:
-                del self.cache[key]
+        shard = self._shard(key)
+        with shard.lock:
+            if key in shard.cache:
+                del shard.cache[key]
                 logger.debug(f"Cache DELETE: {key}")
                 return True
             return False
 
     def clear(self) -> None:
         """Clear all cache entries"""
-        with self.lock:
-            count = len(self.cache)
-            self.cache.clear()
-            logger.info(f"Cache CLEARED: {count} entries removed")
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.cache)
+                shard.cache.clear()
+        logger.info(f"Cache CLEARED: {count} entries removed")
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics
 
+        Counters are read without taking the shard locks, so a stats request
+        never stalls cache traffic; totals may be off by in-flight operations.
+
         Returns:
             Dictionary with cache stats
         """
-        with self.lock:
-            total_requests = self.stats["hits"] + self.stats["misses"]
-            hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
-
-            return {
-                "backend": "simple",
-                "size": len(self.cache),
-                "max_size": self.max_size,
-                "hits": self.stats["hits"],
-                "misses": self.stats["misses"],
-                "sets": self.stats["sets"],
-                "evictions": self.stats["evictions"],
-                "hit_rate": round(hit_rate, 2),
-                "total_requests": total_requests,
-            }
+        size = hits = misses = sets = evictions = 0
+        for shard in self._shards:
+            size += len(shard.cache)
+            hits += shard.hits
+            misses += shard.misses
+            sets += shard.sets
+            evictions += shard.evictions
+
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "backend": "simple",
+            "size": size,
+            "max_size": self.max_size,
+            "shards": len(self._shards),
+            "hits": hits,
+            "misses": misses,
+            "sets": sets,
+            "evictions": evictions,
+            "hit_rate": round(hit_rate, 2),
+            "total_requests": total_requests,
+        }
 
     def cleanup_expired(self) -> int:
         """
@@ -151,16 +241,18 @@ class SimpleCache:
         Returns:
             Number of entries removed
         """
-        with self.lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, entry in self.cache.items() if current_time > entry["expires_at"]
-            ]
-
-            for key in expired_keys:
-                del self.cache[key]
+        removed = 0
+        current_time = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                expired_keys = [
+                    key for key, entry in shard.cache.items() if current_time > entry[1]
+                ]
+                for key in expired_keys:
+                    del shard.cache[key]
+                removed += len(expired_keys)
 
-            if expired_keys:
-                logger.info(f"Cache cleanup: {len(expired_keys)} expired entries removed")
+        if removed:
+            logger.info(f"Cache cleanup: {removed} expired entries removed")
 
-            return len(expired_keys)
+        return removed
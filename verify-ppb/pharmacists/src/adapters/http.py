@@ -4,11 +4,12 @@ Provides resilient HTTP communication with the PPB portal
 """
 
 import random
+import threading
 import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional
+from typing import Optional, Dict, Any
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -57,27 +58,130 @@ class RateLimiter:
 
     CRITICAL: The PPB portal blocks IPs that make requests too quickly.
     Default delay of 1.5s has been tested and prevents blocking.
+
+    Token bucket: up to `capacity` requests may go out back to back, after
+    which requests are admitted at `refill_rate` per second. The default
+    capacity of 1 with a refill rate of 1/delay is exactly a fixed delay.
+
+    Thread-safe: each caller takes its tokens under a lock (letting the
+    balance go negative to reserve a future slot, jitter included) and
+    sleeps outside it, so concurrent requests in one worker stay spaced out.
     """
 
-    def __init__(self, delay: float = 1.5):
+    def __init__(self, delay: float = 1.5, capacity: int = 1, refill_rate: Optional[float] = None):
         """
         Initialize rate limiter
 
         Args:
-            delay: Minimum seconds between requests
+            delay: Minimum seconds between requests once the bucket is empty
+            capacity: Maximum burst size (bucket size in tokens)
+            refill_rate: Tokens added per second (defaults to 1/delay)
         """
         self.delay = delay
-        self.last_request = 0.0
-        logger.debug(f"RateLimiter initialized with {delay}s delay")
-
-    def wait(self):
-        """Wait if necessary to maintain rate limit"""
-        now = time.time()
-        elapsed = now - self.last_request
+        self.capacity = max(1, capacity)
+        if refill_rate is None:
+            refill_rate = 1.0 / delay if delay > 0 else 0.0
+        self.refill_rate = refill_rate
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+        logger.debug(
+            f"RateLimiter initialized with {delay}s delay, capacity={self.capacity}, "
+            f"refill_rate={refill_rate:.3f}/s"
+        )
+
+    def wait(self, tokens: int = 1):
+        """
+        Wait if necessary to maintain rate limit
 
-        if elapsed < self.delay:
-            wait_time = (self.delay - elapsed) + random.uniform(0, 0.05)  # Add small jitter
+        Args:
+            tokens: Number of requests about to be sent
+        """
+        if self.refill_rate <= 0:
+            return  # Rate limiting disabled
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            self.tokens -= tokens
+            if self.tokens < 0:
+                # Add small jitter, reserved too so the next caller queues behind it
+                self.tokens -= random.uniform(0, 0.05) * self.refill_rate
+            wait_time = -self.tokens / self.refill_rate
+
+        if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
             time.sleep(wait_time)
 
-        self.last_request = time.time()
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Token-bucket rate limiter that backs off when the portal pushes back
+
+    Callers report each upstream response: a throttling response (429/503)
+    multiplies the refill rate by `backoff_factor` (floored at `min_rate`),
+    and each success raises it again by `recovery_factor` until it is back at
+    the configured rate. The configured rate is never exceeded.
+    """
+
+    THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        delay: float = 1.5,
+        capacity: int = 1,
+        refill_rate: Optional[float] = None,
+        backoff_factor: float = 0.5,
+        recovery_factor: float = 1.1,
+        min_rate: Optional[float] = None,
+    ):
+        """
+        Initialize adaptive rate limiter
+
+        Args:
+            delay: Minimum seconds between requests once the bucket is empty
+            capacity: Maximum burst size (bucket size in tokens)
+            refill_rate: Tokens added per second (defaults to 1/delay)
+            backoff_factor: Rate multiplier applied on a throttling response
+            recovery_factor: Rate multiplier applied on each success
+            min_rate: Lowest rate backoff may reach (defaults to 1/8 of the configured rate)
+        """
+        super().__init__(delay=delay, capacity=capacity, refill_rate=refill_rate)
+        self.max_rate = self.refill_rate
+        self.min_rate = min_rate if min_rate is not None else self.max_rate / 8
+        self.backoff_factor = backoff_factor
+        self.recovery_factor = recovery_factor
+        self.external_limit_count = 0
+
+    def record_response(self, status_code: int) -> None:
+        """Adjust the rate from an upstream HTTP status code"""
+        if status_code in self.THROTTLE_STATUS_CODES:
+            self.record_rate_limit()
+        elif status_code < 400:
+            self.record_success()
+
+    def record_rate_limit(self) -> None:
+        """Slow down after the portal throttled a request"""
+        if self.max_rate <= 0:
+            return
+        with self.lock:
+            self.external_limit_count += 1
+            self.refill_rate = max(self.min_rate, self.refill_rate * self.backoff_factor)
+            rate = self.refill_rate
+        logger.warning(f"PPB portal throttling detected, rate reduced to {rate:.3f} req/s")
+
+    def record_success(self) -> None:
+        """Recover towards the configured rate after a successful request"""
+        if self.refill_rate >= self.max_rate:
+            return
+        with self.lock:
+            self.refill_rate = min(self.max_rate, self.refill_rate * self.recovery_factor)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current limiter state for the stats endpoints"""
+        return {
+            "rate_limit_rps": round(self.refill_rate, 3),
+            "rate_limit_max_rps": round(self.max_rate, 3),
+            "external_limit_count": self.external_limit_count,
+        }
@@ -6,7 +6,7 @@ from flask import Blueprint, request, jsonify, current_app
 from datetime import datetime
 from pydantic import ValidationError
 
-from ..models.schemas import VerifyRequest, VerifyResponse
+from ..models.schemas import VerifyRequest, VerifyBatchRequest, VerifyResponse
 from ..services.ppb_service import PPBService
 from ..core.logger import get_logger, set_correlation_id, get_correlation_id
 from ..core.version import __version__
@@ -83,6 +83,7 @@ def index():
             "health": "GET /health",
             "ready": "GET /ready",
             "verify": "POST /verify",
+            "verify_batch": "POST /verify/batch",
             "cache_stats": "GET /cache/stats",
             "cache_clear": "DELETE /cache"
         }
@@ -191,6 +192,74 @@ def verify_license():
         }), 500
 
 
+@api_bp.route("/verify/batch", methods=["POST"])
+def verify_batch():
+    """
+    Verify several pharmacist licenses in one request
+
+    Request body:
+    {
+        "license_numbers": ["P2025D00463", "P2025D01204"],
+        "use_cache": true  // optional, defaults to true
+    }
+
+    Response: one result per license number, in request order, each shaped
+    like the /verify response
+    {
+        "success": true,
+        "count": 2,
+        "results": [...]
+    }
+    """
+    if not request.is_json:
+        return jsonify({
+            "success": False,
+            "message": "Content-Type must be application/json",
+            "data": None
+        }), 400
+
+    try:
+        payload = VerifyBatchRequest(**request.get_json())
+
+        max_batch = current_app.config.get("MAX_BATCH_SIZE", 50)
+        if len(payload.license_numbers) > max_batch:
+            return jsonify({
+                "success": False,
+                "message": f"Validation error: at most {max_batch} license numbers per batch",
+                "data": None
+            }), 400
+
+        logger.info(f"Verifying batch of {len(payload.license_numbers)} licenses")
+
+        results = _ppb_service.verify_license_detailed_many(
+            payload.license_numbers,
+            use_cache=payload.use_cache
+        )
+
+        return jsonify({
+            "success": all(r.get("success") for r in results),
+            "count": len(results),
+            "results": results
+        }), 200
+
+    except ValidationError as e:
+        errors = e.errors()
+        error_msg = errors[0]['msg'] if errors else "Invalid request"
+        logger.warning(f"Validation error: {error_msg}")
+        return jsonify({
+            "success": False,
+            "message": f"Validation error: {error_msg}",
+            "data": None
+        }), 400
+    except Exception as e:
+        logger.error(f"Unexpected error in batch verify endpoint: {str(e)}", exc_info=True)
+        return jsonify({
+            "success": False,
+            "message": "Internal server error",
+            "data": None
+        }), 500
+
+
 @api_bp.route("/cache/stats", methods=["GET"])
 def cache_stats():
     """Get cache statistics"""
@@ -4,9 +4,9 @@ Creates and configures the Flask application
 """
 
 import os
-from flask import Flask
+from flask import Flask, request
 from .core.config import get_config
-from .core.logger import setup_logging, get_logger
+from .core.logger import setup_logging, get_logger, set_request_context, clear_request_context
 from .core.version import __version__
 from .api.routes import api_bp, init_service
 from .api.errors import register_error_handlers
@@ -41,15 +41,23 @@ def create_app(config_name=None):
 
     logger.info(f"Starting PPB Pharmacist Verification Service v{__version__} ({config_name} mode)")
 
+    # Snapshot request details once for log records
+    @app.before_request
+    def capture_request_context():
+        set_request_context(request.method, request.path, request.remote_addr)
+
+    @app.teardown_request
+    def release_request_context(exc=None):
+        clear_request_context()
+
     # Register blueprints
     app.register_blueprint(api_bp)
 
     # Register error handlers
     register_error_handlers(app)
 
-    # Initialize services
-    with app.app_context():
-        init_service(app)
+    # Initialize services (reads app.config directly; no app context needed)
+    init_service(app)
 
     logger.info("Application initialized successfully")
 
@@ -28,11 +28,20 @@ class Config:
 
     # Rate Limiting (CRITICAL - prevents IP blocking)
     RATE_LIMIT_DELAY = float(os.environ.get("RATE_LIMIT_DELAY", "1.5"))
+    PPB_BUCKET_CAPACITY = int(os.environ.get("PPB_BUCKET_CAPACITY", "1"))  # burst size
+    PPB_REFILL_RATE = (
+        float(os.environ["PPB_REFILL_RATE"]) if os.environ.get("PPB_REFILL_RATE") else None
+    )  # tokens/second, defaults to 1/RATE_LIMIT_DELAY
+
+    # Batch verification
+    MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "50"))
+    BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "4"))
 
     # Caching Configuration
     CACHE_ENABLED = os.environ.get("CACHE_ENABLED", "true").lower() == "true"
     CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "simple")  # 'simple' or 'redis'
     CACHE_TTL = int(os.environ.get("CACHE_TTL", "3600"))  # 1 hour default
+    NEGATIVE_CACHE_TTL = int(os.environ.get("NEGATIVE_CACHE_TTL", "300"))  # "not found" results
     CACHE_MAX_SIZE = int(os.environ.get("CACHE_MAX_SIZE", "1000"))
     REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/2")  # Different DB from facilities and pharmtechs
 
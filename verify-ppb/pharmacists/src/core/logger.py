@@ -4,24 +4,38 @@ Supports both JSON and text formats with correlation ID tracking
 """
 
 import logging
+import os
 import sys
 import json
-import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Dict, Tuple
 from contextvars import ContextVar
-from flask import has_request_context, request
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - falls back to stdlib json
+    orjson = None
 
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
+# Context variable for the current HTTP request (method, path, remote_addr),
+# captured once per request so log records don't go through Flask's proxies
+request_context: ContextVar[Optional[Dict[str, str]]] = ContextVar("request_context", default=None)
+
+# Bound once for the per-record formatter paths
+_cid_get = correlation_id.get
+_request_ctx_get = request_context.get
+_utcnow = datetime.utcnow
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
 
     def format(self, record):
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # orjson renders the naive UTC datetime itself (same "...Z" form)
+            "timestamp": _utcnow() if orjson is not None else _utcnow().isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -31,17 +45,14 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add correlation ID if available
-        corr_id = correlation_id.get()
+        corr_id = _cid_get()
         if corr_id:
             log_data["correlation_id"] = corr_id
 
         # Add request context if available
-        if has_request_context():
-            log_data["request"] = {
-                "method": request.method,
-                "path": request.path,
-                "remote_addr": request.remote_addr,
-            }
+        req_ctx = _request_ctx_get()
+        if req_ctx:
+            log_data["request"] = req_ctx
 
         # Add exception info if present
         if record.exc_info:
@@ -51,51 +62,85 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_data"):
             log_data.update(record.extra_data)
 
+        if orjson is not None:
+            return orjson.dumps(
+                log_data,
+                option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            ).decode()
         return json.dumps(log_data)
 
 
 class TextFormatter(logging.Formatter):
     """Human-readable text formatter for development"""
 
+    def __init__(self):
+        super().__init__()
+        # Built once; the correlation ID is passed in as a record attribute
+        self._plain = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        self._with_cid = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s [CID:%(correlation_id_short)s] - %(message)s"
+        )
+
     def format(self, record):
-        corr_id = correlation_id.get()
-        corr_str = f" [CID:{corr_id[:8]}]" if corr_id else ""
+        corr_id = _cid_get()
+        if not corr_id:
+            return self._plain.format(record)
+
+        record.correlation_id_short = corr_id[:8]
+        return self._with_cid.format(record)
+
 
-        base_format = f"%(asctime)s - %(name)s - %(levelname)s{corr_str} - %(message)s"
-        formatter = logging.Formatter(base_format)
-        return formatter.format(record)
+# (level, format) applied by the last setup_logging call, and its handler
+_configured: Optional[Tuple[str, str]] = None
+_handler: Optional[logging.Handler] = None
 
 
 def setup_logging(log_level: str = "INFO", log_format: str = "json"):
     """
     Setup application logging
 
+    Repeated calls with the same settings (e.g. every create_app) are no-ops
+    while the handler installed by the first call is still in place.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Format type ('json' or 'text')
     """
-    # Remove existing handlers
+    global _configured, _handler
+
+    settings = (log_level.upper(), log_format.lower())
     root_logger = logging.getLogger()
+    if settings == _configured and _handler in root_logger.handlers:
+        return
+
+    # Remove existing handlers
     root_logger.handlers = []
 
-    # Create handler
+    level = logging.getLevelNamesMapping()[settings[0]]
+
+    # Create handler; its level drops records below the configured level
+    # before they reach the formatter, even if a module logger is more verbose
     handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(level)
 
     # Set formatter
-    if log_format.lower() == "json":
+    if settings[1] == "json":
         handler.setFormatter(JSONFormatter())
     else:
         handler.setFormatter(TextFormatter())
 
     # Configure root logger
     root_logger.addHandler(handler)
-    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.setLevel(level)
 
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
+    _configured = settings
+    _handler = handler
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -115,14 +160,35 @@ def set_correlation_id(corr_id: Optional[str] = None):
     Set correlation ID for request tracking
 
     Args:
-        corr_id: Correlation ID (generates UUID if None)
+        corr_id: Correlation ID (generates a random 128-bit hex ID if None)
     """
     if corr_id is None:
-        corr_id = str(uuid.uuid4())
+        corr_id = os.urandom(16).hex()
     correlation_id.set(corr_id)
     return corr_id
 
 
+def set_request_context(method: str, path: str, remote_addr: Optional[str]):
+    """
+    Record the current request for JSON log records
+
+    Args:
+        method: HTTP method
+        path: Request path
+        remote_addr: Client address
+    """
+    request_context.set({
+        "method": method,
+        "path": path,
+        "remote_addr": remote_addr,
+    })
+
+
+def clear_request_context():
+    """Forget the request recorded by set_request_context"""
+    request_context.set(None)
+
+
 def get_correlation_id() -> Optional[str]:
     """Get current correlation ID"""
     return correlation_id.get()
@@ -3,7 +3,7 @@ Pydantic models for request/response validation
 Provides automatic validation, serialization, and OpenAPI schema generation
 """
 
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -29,6 +29,27 @@ class VerifyRequest(BaseModel):
         return v.strip().upper()
 
 
+class VerifyBatchRequest(BaseModel):
+    """Request model for verifying several pharmacist licenses in one call"""
+
+    license_numbers: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Pharmacist license numbers to verify",
+        examples=[["P2025D00463", "P2025D01204"]],
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use cached results if available",
+    )
+
+    @field_validator("license_numbers")
+    @classmethod
+    def normalize_license_numbers(cls, v: List[str]) -> List[str]:
+        """Normalize each license number by stripping whitespace and converting to uppercase"""
+        return [n.strip().upper() for n in v]
+
+
 class PharmacistData(BaseModel):
     """Complete pharmacist verification data"""
 
@@ -50,6 +71,9 @@ class VerifyResponse(BaseModel):
     message: str = Field(..., description="Human-readable message about the result")
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
     from_cache: bool = Field(..., description="Whether result was served from cache")
+    not_found: bool = Field(
+        False, description="Whether the license is absent from the registry"
+    )
     data: Optional[PharmacistData] = Field(
         None, description="Pharmacist data (null if verification failed)"
     )
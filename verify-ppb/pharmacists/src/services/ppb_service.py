@@ -11,16 +11,69 @@ CRITICAL: This follows the same pattern as pharmtechs service but with:
 
 import re
 import time
-from typing import Dict, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
 
 from ..core.config import Config
 from ..core.logger import get_logger
-from ..adapters.http import build_session, RateLimiter
+from ..adapters.http import build_session, AdaptiveRateLimiter
 from ..adapters.cache_redis import get_cache
 
 logger = get_logger(__name__)
 
+# Last formatted verified_at timestamp, as (epoch second, ISO string)
+_LAST_TIMESTAMP = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as "%Y-%m-%dT%H:%M:%SZ", formatted at most once per second
+
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _LAST_TIMESTAMP
+    now = int(time.time())
+    second, formatted = _LAST_TIMESTAMP
+    if second != now:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _LAST_TIMESTAMP = (now, formatted)
+    return formatted
+
+
+# Regex patterns compiled once at import and reused for every verification
+
+# License format: P + (2023-2029) + letter + 5 digits
+_LICENSE_RE = re.compile(r'^P202[3-9][A-Z]\d{5}$', re.IGNORECASE)
+
+# Encoded pharmacist ID in the search results' "View Details" link
+_ID_RE = re.compile(r"rel='([^']+)'")
+
+# The portal's markup and labels always use the case shown in the docstrings
+# below, so the HTML patterns match case-sensitively (smaller, faster scans)
+
+# Search results row
+_NAME_SEARCH_RE = re.compile(r"<td[^>]*>([^<]+)</td>\s*<td[^>]*>P")
+_LICENSE_TD_RE = re.compile(r"<td[^>]*>(P\d+[A-Z]\d+)</td>")
+_STATUS_RE = re.compile(r"Status:\s*([^<]+)")
+_VALID_TILL_RE = re.compile(r"&nbsp;\s*([\d-]+)</td>")
+
+# Details page: every field in one scan. Each alternative sits in a lookahead
+# so matches don't consume text (a field's first occurrence may lie inside
+# another field's match), and the leading class skips most positions cheaply.
+# Group names are the info keys, in output order.
+_DETAIL_FIELDS_RE = re.compile(
+    r'(?=[<PSV])(?='
+    r'<b style="font-size:30px;">\s*(?P<full_name>[^<]+)\s*</b>'
+    r'|Practice License Number:\s*(?P<practice_license_number>[^<]+)'
+    r'|Status:\s*(?P<status>[^<]+)</span>'
+    r'|Valid Till:\s*(?P<valid_till>[\d-]+)'
+    r'|<img src="(?P<photo_url>[^"]+)"\s+width="200"'
+    r')'
+)
+_DETAIL_FIELDS = tuple(_DETAIL_FIELDS_RE.groupindex)
+
 
 class PPBVerificationError(Exception):
     """Base exception for PPB verification errors"""
@@ -79,6 +132,10 @@ class PPBService:
             "Referer": f"{self.ppb_base_url}/LicenseStatus?register=pharmacist"
         }
 
+        # Urlencoded search body up to the search text - CRITICAL: These exact
+        # parameters are required (cadre_id 2 is the fixed value for Pharmacists)
+        self._search_prefix = b"search_register=1&cadre_id=2&search_text="
+
         # Details headers - for GET details request
         self.details_headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -96,8 +153,13 @@ class PPBService:
         }
 
         # Rate limiter - CRITICAL: Prevents IP blocking
+        # Backs off further when the portal answers 429/503
         delay = rate_limit_delay if rate_limit_delay is not None else Config.RATE_LIMIT_DELAY
-        self.rate_limiter = RateLimiter(delay=delay)
+        self.rate_limiter = AdaptiveRateLimiter(
+            delay=delay,
+            capacity=Config.PPB_BUCKET_CAPACITY,
+            refill_rate=Config.PPB_REFILL_RATE
+        )
 
         # Cache setup
         self.use_cache = use_cache and Config.CACHE_ENABLED
@@ -137,9 +199,7 @@ class PPBService:
         Returns:
             True if valid format, False otherwise
         """
-        # Pattern: P + (2023-2029) + letter + 5 digits
-        pattern = r'^P202[3-9][A-Z]\d{5}$'
-        return bool(re.match(pattern, license_number, re.IGNORECASE))
+        return bool(_LICENSE_RE.match(license_number))
 
     def search_pharmacist(self, license_number: str) -> Optional[str]:
         """
@@ -156,12 +216,8 @@ class PPBService:
         """
         self.rate_limiter.wait()
 
-        # Build POST payload - CRITICAL: These exact parameters are required
-        payload = {
-            "search_register": "1",
-            "cadre_id": "2",  # Fixed value for Pharmacists
-            "search_text": license_number
-        }
+        # Same bytes requests would urlencode from the payload dict
+        payload = self._search_prefix + quote_plus(license_number).encode("ascii")
 
         try:
             logger.debug(f"Searching PPB portal for: {license_number}")
@@ -171,6 +227,7 @@ class PPBService:
                 headers=self.search_headers,
                 timeout=self.timeout
             )
+            self.rate_limiter.record_response(response.status_code)
             response.raise_for_status()
             logger.debug(f"Search successful for: {license_number}")
             return response.text
@@ -191,8 +248,10 @@ class PPBService:
         Returns:
             Base64-encoded pharmacist ID (e.g., "NDI5ODI=")
         """
-        # Extract encoded ID from rel attribute
-        id_match = re.search(r"rel='([^']+)'", html)
+        # Extract encoded ID from rel attribute ("No records found" pages have none)
+        if "rel='" not in html:
+            return None
+        id_match = _ID_RE.search(html)
         if id_match:
             pharmacist_id = id_match.group(1)
             logger.debug(f"Extracted pharmacist ID: {pharmacist_id}")
@@ -220,23 +279,24 @@ class PPBService:
         """
         data = {}
 
-        # Extract name (first <td> before license number)
-        name_match = re.search(r"<td[^>]*>([^<]+)</td>\s*<td[^>]*>P", html, re.IGNORECASE)
-        if name_match:
-            data['name'] = name_match.group(1).strip()
+        if "<td" in html:
+            # Extract name (first <td> before license number)
+            name_match = _NAME_SEARCH_RE.search(html)
+            if name_match:
+                data['name'] = name_match.group(1).strip()
 
-        # Extract license number
-        license_match = re.search(r"<td[^>]*>(P\d+[A-Z]\d+)</td>", html, re.IGNORECASE)
-        if license_match:
-            data['license_number'] = license_match.group(1).strip()
+            # Extract license number
+            license_match = _LICENSE_TD_RE.search(html)
+            if license_match:
+                data['license_number'] = license_match.group(1).strip()
 
         # Extract status
-        status_match = re.search(r"Status:\s*([^<]+)", html, re.IGNORECASE)
+        status_match = _STATUS_RE.search(html) if "Status:" in html else None
         if status_match:
             data['status'] = status_match.group(1).strip()
 
         # Extract valid_till date
-        valid_till_match = re.search(r"&nbsp;\s*([\d-]+)</td>", html)
+        valid_till_match = _VALID_TILL_RE.search(html) if "&nbsp;" in html else None
         if valid_till_match:
             data['valid_till'] = valid_till_match.group(1).strip()
 
@@ -267,6 +327,7 @@ class PPBService:
                 headers=self.details_headers,
                 timeout=self.timeout
             )
+            self.rate_limiter.record_response(response.status_code)
 
             if response.status_code == 200:
                 html = response.text
@@ -297,32 +358,16 @@ class PPBService:
         Returns:
             Dictionary with all extracted fields
         """
-        info = {}
-
-        # Extract full name (with proper capitalization)
-        name_match = re.search(r'<b style="font-size:30px;">\s*([^<]+)\s*</b>', html, re.IGNORECASE)
-        if name_match:
-            info['full_name'] = name_match.group(1).strip()
-
-        # Extract practice license number
-        license_match = re.search(r'Practice License Number:\s*([^<]+)', html, re.IGNORECASE)
-        if license_match:
-            info['practice_license_number'] = license_match.group(1).strip()
+        # First occurrence of each field, in one pass over the page
+        found = {}
+        for match in _DETAIL_FIELDS_RE.finditer(html):
+            field = match.lastgroup
+            if field not in found:
+                found[field] = match[field].strip()
+                if len(found) == len(_DETAIL_FIELDS):
+                    break
 
-        # Extract status
-        status_match = re.search(r'Status:\s*([^<]+)</span>', html, re.IGNORECASE)
-        if status_match:
-            info['status'] = status_match.group(1).strip()
-
-        # Extract valid_till date
-        valid_till_match = re.search(r'Valid Till:\s*([\d-]+)', html, re.IGNORECASE)
-        if valid_till_match:
-            info['valid_till'] = valid_till_match.group(1).strip()
-
-        # Extract photo URL
-        photo_match = re.search(r'<img src="([^"]+)"\s+width="200"', html, re.IGNORECASE)
-        if photo_match:
-            info['photo_url'] = photo_match.group(1).strip()
+        info = {field: found[field] for field in _DETAIL_FIELDS if field in found}
 
         return info
 
@@ -366,6 +411,12 @@ class PPBService:
                     logger.info(f"Cache hit for: {license_number}")
                     return cached_result
 
+                # Recently confirmed "not found" licenses skip the portal entirely
+                negative_result = self.cache.get(f"negative:{license_number}")
+                if negative_result is not None:
+                    logger.info(f"Negative cache hit for: {license_number}")
+                    return {**negative_result, "from_cache": True}
+
             # STEP 1: Search for pharmacist
             search_html = self.search_pharmacist(license_number)
 
@@ -402,7 +453,7 @@ class PPBService:
                 raise PPBVerificationError("Failed to extract complete pharmacist information")
 
             # Add metadata
-            final_data['verified_at'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+            final_data['verified_at'] = _iso_now()
 
             processing_time = round((time.time() - start_time) * 1000, 2)
 
@@ -426,14 +477,21 @@ class PPBService:
         except PharmacistNotFoundError as e:
             processing_time = round((time.time() - start_time) * 1000, 2)
             logger.warning(f"Pharmacist not found: {license_number}")
-            return {
+            result = {
                 "success": False,
                 "license_number": license_number,
                 "message": str(e),
                 "processing_time_ms": processing_time,
                 "from_cache": False,
+                "not_found": True,
                 "data": None
             }
+
+            # Remember the miss briefly so retries of a mistyped license don't hit PPB
+            if use_cache and self.use_cache:
+                self.cache.set(f"negative:{license_number}", dict(result), Config.NEGATIVE_CACHE_TTL)
+
+            return result
         except PPBVerificationError as e:
             processing_time = round((time.time() - start_time) * 1000, 2)
             logger.error(f"Verification error for {license_number}: {str(e)}")
@@ -457,13 +515,73 @@ class PPBService:
                 "data": None
             }
 
+    def verify_license_detailed_many(self, license_numbers: List[str], use_cache: bool = True) -> List[Dict]:
+        """
+        Verify several pharmacist licenses concurrently
+
+        Cached entries (including recent "not found" results) are read with a
+        single get_many call; each distinct miss is then verified once on a
+        small thread pool, so portal round trips overlap while the shared
+        rate limiter still spaces the requests themselves, and the fresh
+        results are written back with set_many.
+
+        Args:
+            license_numbers: Pharmacist license numbers
+            use_cache: Whether to use cache
+
+        Returns:
+            Verification results in the same order as license_numbers
+        """
+        numbers = [n.strip().upper() if isinstance(n, str) else n for n in license_numbers]
+        results: List[Optional[Dict]] = [None] * len(numbers)
+        caching = use_cache and self.use_cache
+
+        if caching:
+            cached = self.cache.get_many(
+                [f"detailed:{n}" for n in numbers] + [f"negative:{n}" for n in numbers]
+            )
+            positive, negative = cached[:len(numbers)], cached[len(numbers):]
+            for idx, cached_result in enumerate(positive):
+                cached_result = cached_result if cached_result is not None else negative[idx]
+                if cached_result is not None:
+                    results[idx] = {**cached_result, "from_cache": True}
+
+        # Each distinct miss is fetched once, even if repeated in the batch
+        misses = list(dict.fromkeys(n for n, r in zip(numbers, results) if r is None))
+        if misses:
+            logger.info(f"Batch verification: {len(numbers) - len(misses)} cached, {len(misses)} to fetch")
+            workers = max(1, min(len(misses), Config.BATCH_MAX_WORKERS))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ppb-batch") as executor:
+                fetched = dict(zip(
+                    misses,
+                    executor.map(lambda n: self.verify_license_detailed(n, use_cache=False), misses)
+                ))
+
+            if caching:
+                to_cache = {
+                    f"detailed:{n}": result for n, result in fetched.items() if result.get("success")
+                }
+                if to_cache:
+                    self.cache.set_many(to_cache, self.cache_ttl)
+
+                not_found = {
+                    f"negative:{n}": result for n, result in fetched.items() if result.get("not_found")
+                }
+                if not_found:
+                    self.cache.set_many(not_found, Config.NEGATIVE_CACHE_TTL)
+
+            results = [r if r is not None else fetched[n] for n, r in zip(numbers, results)]
+
+        return results
+
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
         if not self.use_cache or self.cache is None:
-            return {"cache_enabled": False}
+            return {"cache_enabled": False, **self.rate_limiter.get_stats()}
 
         stats = self.cache.get_stats()
         stats['cache_enabled'] = True
+        stats.update(self.rate_limiter.get_stats())
         return stats
 
     def clear_cache(self) -> bool:
@@ -3,6 +3,8 @@ Pytest configuration and shared fixtures
 Provides test data, fixtures, and utilities for the test suite
 """
 
+import threading
+
 try:
     import pytest
     PYTEST_AVAILABLE = True
@@ -72,6 +74,9 @@ ERROR_TEST_CASES = [
     }
 ]
 
+# Found by the fake portal, which then fails to return its details page
+DETAILS_FAILURE_LICENSE = "P2025D00999"
+
 # Performance thresholds
 PERFORMANCE_THRESHOLDS = {
     "max_response_time": 3000,  # 3 seconds in milliseconds
@@ -101,6 +106,37 @@ if PYTEST_AVAILABLE:
         )
 
 
+    @pytest.fixture
+    def fake_portal(cached_service, monkeypatch):
+        """
+        Answer cached_service's portal steps in memory instead of over the network
+
+        ERROR_TEST_CASES[0] is not found, DETAILS_FAILURE_LICENSE is found but
+        its details page cannot be fetched. Returns the list of licenses searched.
+        """
+        searches = []
+        lock = threading.Lock()
+
+        def search_pharmacist(license_number):
+            with lock:
+                searches.append(license_number)
+            if license_number == ERROR_TEST_CASES[0]["license_number"]:
+                return "No records found"
+            return license_number
+
+        monkeypatch.setattr(cached_service, "search_pharmacist", search_pharmacist)
+        monkeypatch.setattr(cached_service, "extract_pharmacist_id", lambda html: html)
+        monkeypatch.setattr(cached_service, "extract_search_data", lambda html: {})
+        monkeypatch.setattr(
+            cached_service, "get_pharmacist_details",
+            lambda pharmacist_id: None if pharmacist_id == DETAILS_FAILURE_LICENSE else pharmacist_id
+        )
+        monkeypatch.setattr(
+            cached_service, "parse_detailed_html", lambda html: {"practice_license_number": html}
+        )
+        return searches
+
+
     @pytest.fixture
     def real_test_cases():
         """Provide real test cases for verification"""
@@ -0,0 +1,70 @@
+"""
+Batch Verification Tests
+Tests the cache side of verify_license_detailed_many (no portal access needed)
+"""
+
+import pytest
+
+from tests.conftest import DETAILS_FAILURE_LICENSE, ERROR_TEST_CASES
+
+UNKNOWN_LICENSE = ERROR_TEST_CASES[0]["license_number"]
+
+
+@pytest.mark.unit
+class TestBatchCacheLookup:
+    """Test how the single get_many over detailed: and negative: keys is read"""
+
+    def test_positive_entry_takes_precedence(self, cached_service, fake_portal):
+        """Test that a detailed: hit wins over a negative: entry for the same license"""
+        entry = {"license_number": "P2025D00001"}
+        cached_service.cache.set("detailed:P2025D00001", {**entry, "success": True})
+        cached_service.cache.set("negative:P2025D00001", {**entry, "success": False})
+
+        results = cached_service.verify_license_detailed_many(["P2025D00001"])
+
+        assert results[0]["success"] is True
+        assert results[0]["from_cache"] is True
+        assert fake_portal == []
+
+    def test_negative_entry_skips_portal(self, cached_service, fake_portal):
+        """Test that a negative: entry alone answers without searching"""
+        cached_service.cache.set(
+            f"negative:{UNKNOWN_LICENSE}",
+            {"success": False, "license_number": UNKNOWN_LICENSE, "not_found": True}
+        )
+
+        results = cached_service.verify_license_detailed_many([UNKNOWN_LICENSE.lower()])
+
+        assert results[0]["not_found"] is True
+        assert results[0]["from_cache"] is True
+        assert fake_portal == []
+
+
+@pytest.mark.unit
+class TestBatchCacheWriteBack:
+    """Test what set_many writes after the misses are verified"""
+
+    def test_not_found_written_to_negative_key(self, cached_service, fake_portal):
+        """Test that a not-found miss is stored under negative: only"""
+        cached_service.verify_license_detailed_many([UNKNOWN_LICENSE])
+
+        negative = cached_service.cache.get(f"negative:{UNKNOWN_LICENSE}")
+        assert negative is not None
+        assert negative["not_found"] is True
+        assert cached_service.cache.get(f"detailed:{UNKNOWN_LICENSE}") is None
+
+    def test_success_written_to_detailed_key(self, cached_service, fake_portal):
+        """Test that a successful miss is stored under detailed: only"""
+        cached_service.verify_license_detailed_many(["P2025D00001"])
+
+        assert cached_service.cache.get("detailed:P2025D00001")["success"] is True
+        assert cached_service.cache.get("negative:P2025D00001") is None
+
+    def test_portal_failure_not_cached(self, cached_service, fake_portal):
+        """Test that a failure other than not-found is retried on the next batch"""
+        results = cached_service.verify_license_detailed_many([DETAILS_FAILURE_LICENSE])
+
+        assert results[0]["success"] is False
+        assert "not_found" not in results[0]
+        assert cached_service.cache.get(f"negative:{DETAILS_FAILURE_LICENSE}") is None
+        assert cached_service.cache.get(f"detailed:{DETAILS_FAILURE_LICENSE}") is None
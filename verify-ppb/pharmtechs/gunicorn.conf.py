@@ -6,12 +6,19 @@ import os
 import multiprocessing
 
 # Server socket
-bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5001')}"
 backlog = 2048
+# SO_REUSEPORT: a replacement master (rolling restart, second container on
+# the host network) can bind the port while the old one drains
+reuse_port = True
 
 # Worker processes
 workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
-worker_class = "sync"
+# Threaded workers: a verification spends nearly all its time waiting on the
+# PPB portal (or on the rate limiter), so each worker serves several requests
+# concurrently while its shared PPBService keeps one limiter and pool
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
@@ -19,6 +26,11 @@ timeout = 60
 graceful_timeout = 30
 keepalive = 5
 
+# preload_app is left off here so `python run.py --reload` can restart
+# workers on code changes; the Dockerfile passes --preload in production,
+# where the app is imported once in the master and each worker then builds
+# its own PPBService in post_fork below
+
 # Logging
 accesslog = "-"  # stdout
 errorlog = "-"   # stderr
@@ -39,3 +51,13 @@ tmp_upload_dir = None
 # SSL (if needed)
 # keyfile = None
 # certfile = None
+
+
+def post_fork(server, worker):
+    """Give each worker its own PPB session, rate limiter and cache"""
+    # With --preload the service built in the master holds sockets and locks
+    # that must not be shared across processes, so it is replaced once per worker
+    from src.api.routes import init_service
+    from src.app import app
+
+    init_service(app)
@@ -1,8 +1,22 @@
 """
 Simple entry point for running the PharmTech verification service
+
+Starts the same Gunicorn server as production (gunicorn.conf.py); extra
+arguments are passed through, e.g. `python run.py --reload`
 """
 
-from src.app import app
+import os
+import sys
+
+from gunicorn.app.wsgiapp import run
 
 if __name__ == "__main__":
-    app.run()
+    root = os.path.dirname(os.path.abspath(__file__))
+    sys.argv = [
+        "gunicorn",
+        "--chdir", root,
+        "-c", os.path.join(root, "gunicorn.conf.py"),
+        *sys.argv[1:],
+        "src.app:app",
+    ]
+    sys.exit(run())
@@ -4,7 +4,7 @@ Provides shared cache across multiple workers/pods
 """
 
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -57,10 +57,10 @@ class RedisCache:
             value = self.redis.get(full_key)
 
             if value is None:
-                logger.debug(f"Cache MISS: {key}")
+                logger.debug("Cache MISS: %s", key)
                 return None
 
-            logger.debug(f"Cache HIT: {key}")
+            logger.debug("Cache HIT: %s", key)
             return json.loads(value)
         except Exception as e:
             logger.error(f"Cache GET error for {key}: {e}")
@@ -81,10 +81,63 @@ class RedisCache:
                 ttl = self.default_ttl
 
             self.redis.setex(full_key, ttl, json.dumps(value))
-            logger.debug(f"Cache SET: {key} (ttl={ttl}s)")
+            logger.debug("Cache SET: %s (ttl=%ss)", key, ttl)
         except Exception as e:
             logger.error(f"Cache SET error for {key}: {e}")
 
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Get several values in a single MGET round-trip
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys, None for misses
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            raw_values = self.redis.mget([self._make_key(k) for k in keys])
+        except Exception as e:
+            logger.error(f"Cache MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+        results = []
+        for key, raw in zip(keys, raw_values):
+            if raw is None:
+                results.append(None)
+                continue
+            try:
+                results.append(json.loads(raw))
+            except Exception as e:
+                logger.error(f"Cache GET error for {key}: {e}")
+                results.append(None)
+        logger.debug("Cache MGET: %s/%s hits", sum(r is not None for r in results), len(keys))
+        return results
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Set several values in a single pipelined round-trip
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        if not items:
+            return
+        if ttl is None:
+            ttl = self.default_ttl
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(self._make_key(key), ttl, json.dumps(value))
+            pipe.execute()
+            logger.debug("Cache MSET: %s keys (ttl=%ss)", len(items), ttl)
+        except Exception as e:
+            logger.error(f"Cache MSET error for {len(items)} keys: {e}")
+
     def delete(self, key: str) -> bool:
         """
         Delete key from cache
@@ -98,7 +151,7 @@ class RedisCache:
         try:
             full_key = self._make_key(key)
             result = self.redis.delete(full_key)
-            logger.debug(f"Cache DELETE: {key}")
+            logger.debug("Cache DELETE: %s", key)
             return result > 0
         except Exception as e:
             logger.error(f"Cache DELETE error for {key}: {e}")
@@ -4,7 +4,7 @@ Thread-safe cache with TTL and LRU eviction
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from collections import OrderedDict
 import threading
 from ..core.logger import get_logger
@@ -48,7 +48,7 @@ class SimpleCache:
         with self.lock:
             if key not in self.cache:
                 self.stats["misses"] += 1
-                logger.debug(f"Cache MISS: {key}")
+                logger.debug("Cache MISS: %s", key)
                 return None
 
             entry = self.cache[key]
@@ -58,13 +58,13 @@ class SimpleCache:
             if current_time > entry["expires_at"]:
                 del self.cache[key]
                 self.stats["misses"] += 1
-                logger.debug(f"Cache MISS (expired): {key}")
+                logger.debug("Cache MISS (expired): %s", key)
                 return None
 
             # Move to end (LRU)
             self.cache.move_to_end(key)
             self.stats["hits"] += 1
-            logger.debug(f"Cache HIT: {key}")
+            logger.debug("Cache HIT: %s", key)
             return entry["value"]
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
@@ -84,7 +84,7 @@ class SimpleCache:
             if key not in self.cache and len(self.cache) >= self.max_size:
                 evicted_key = self.cache.popitem(last=False)[0]
                 self.stats["evictions"] += 1
-                logger.debug(f"Cache EVICTED: {evicted_key}")
+                logger.debug("Cache EVICTED: %s", evicted_key)
 
             self.cache[key] = {
                 "value": value,
@@ -95,7 +95,30 @@ class SimpleCache:
             # Move to end (most recently used)
             self.cache.move_to_end(key)
             self.stats["sets"] += 1
-            logger.debug(f"Cache SET: {key} (ttl={ttl}s)")
+            logger.debug("Cache SET: %s (ttl=%ss)", key, ttl)
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        Get several values (in-memory lookups need no batching)
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys, None for misses/expired
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Set several values
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl)
 
     def delete(self, key: str) -> bool:
         """
@@ -110,7 +133,7 @@ class SimpleCache:
         with self.lock:
             if key in self.cache:
                 del self.cache[key]
-                logger.debug(f"Cache DELETE: {key}")
+                logger.debug("Cache DELETE: %s", key)
                 return True
             return False
 
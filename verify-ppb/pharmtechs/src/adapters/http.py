@@ -4,23 +4,36 @@ Provides resilient HTTP communication with the PPB portal
 """
 
 import random
+import threading
 import time
+from email.utils import parsedate_to_datetime
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional
+from collections import deque
+from typing import Optional, Dict, Any
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-def build_session(max_retries: int = 2, backoff: float = 0.3) -> requests.Session:
+def build_session(
+    max_retries: int = 2,
+    backoff: float = 0.3,
+    pool_connections: int = 1,
+    pool_maxsize: int = 64,
+) -> requests.Session:
     """
-    Build a requests session with retry logic
+    Build a requests session with retry logic and persistent connections
 
     Args:
         max_retries: Maximum number of retries
         backoff: Backoff factor for exponential backoff
+        pool_connections: Number of per-host connection pools to keep (only
+            the PPB portal is called)
+        pool_maxsize: Keep-alive connections kept per host (sized above the
+            number of threads that can hit the portal at once, so no thread
+            has to open and discard an extra connection)
 
     Returns:
         Configured requests session
@@ -39,14 +52,21 @@ def build_session(max_retries: int = 2, backoff: float = 0.3) -> requests.Sessio
     # Mount adapter with retry strategy
     adapter = HTTPAdapter(
         max_retries=retry_strategy,
-        pool_connections=10,
-        pool_maxsize=10,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
     )
 
     session.mount("https://", adapter)
     session.mount("http://", adapter)
 
-    logger.debug(f"HTTP session created with max_retries={max_retries}, backoff={backoff}")
+    # Search and details legs both reuse the same pooled TCP/TLS connection
+    session.headers["Connection"] = "keep-alive"
+
+    logger.debug(
+        f"HTTP session created with max_retries={max_retries}, backoff={backoff}, "
+        f"pool_maxsize={pool_maxsize}"
+    )
 
     return session
 
@@ -57,8 +77,23 @@ class RateLimiter:
 
     CRITICAL: The PPB portal blocks IPs that make requests too quickly.
     Default delay of 1.5s has been tested and prevents blocking.
+
+    Thread-safe: each caller reserves the next send slot on the monotonic
+    clock under a lock and sleeps outside it, so concurrent requests in one
+    worker are spaced at least `delay` apart without oversleeping.
+
+    Responses fed to update_from_response() can only slow it down further:
+    Retry-After, or an X-RateLimit-Remaining quota close to exhaustion, pauses
+    callers until the server's reset time. `delay` always remains the floor.
     """
 
+    # Pause until reset once remaining quota falls to this many requests...
+    MIN_REMAINING = 2
+    # ...or below this fraction of X-RateLimit-Limit
+    MIN_REMAINING_RATIO = 0.1
+    # Ignore server pauses longer than this (misconfigured/hostile headers)
+    MAX_PAUSE = 300.0
+
     def __init__(self, delay: float = 1.5):
         """
         Initialize rate limiter
@@ -67,17 +102,225 @@ class RateLimiter:
             delay: Minimum seconds between requests
         """
         self.delay = delay
-        self.last_request = 0.0
+        self.next_allowed = 0.0  # time.monotonic() of the next free slot
+        self.lock = threading.Lock()
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_at = 0.0  # time.monotonic() until which PPB asked us to pause
         logger.debug(f"RateLimiter initialized with {delay}s delay")
 
     def wait(self):
         """Wait if necessary to maintain rate limit"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_allowed)
+            paused = self.reset_at > slot
+            if paused:
+                slot = self.reset_at
+            self.next_allowed = slot + self.delay + random.uniform(0, 0.05)  # Add small jitter
+
+        sleep_for = slot - now
+        if sleep_for > 0:
+            if paused:
+                logger.info("Rate limiting: PPB quota exhausted, pausing %.2fs", sleep_for)
+            else:
+                logger.debug("Rate limiting: waiting %.2fs", sleep_for)
+            time.sleep(sleep_for)
+
+    def update_from_response(self, response: requests.Response) -> None:
+        """
+        Record rate-limit headers from a PPB response
+
+        Args:
+            response: Response returned by the portal
+        """
+        headers = response.headers
+        # Headers carry wall-clock times; the pause itself is kept on the monotonic clock
         now = time.time()
-        elapsed = now - self.last_request
+        pause_until = 0.0
+
+        retry_after = _parse_retry_after(headers.get("Retry-After"), now)
+        if retry_after is not None:
+            pause_until = retry_after
+
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        reset = _parse_reset(headers.get("X-RateLimit-Reset"), now)
+        if remaining is not None and reset is not None:
+            low = remaining <= self.MIN_REMAINING or (
+                limit and remaining / limit < self.MIN_REMAINING_RATIO
+            )
+            if low:
+                pause_until = max(pause_until, reset)
+
+        with self.lock:
+            if remaining is not None:
+                self.remaining = remaining
+            if limit is not None:
+                self.limit = limit
+            if pause_until > now:
+                pause = min(pause_until - now, self.MAX_PAUSE)
+                self.reset_at = max(self.reset_at, time.monotonic() + pause)
+                logger.warning(
+                    f"PPB rate limit reached (remaining={remaining}), "
+                    f"pausing requests for {pause:.1f}s"
+                )
+
+
+class AIMDController:
+    """
+    Adaptive concurrency limit for PPB portal calls (additive increase,
+    multiplicative decrease)
+
+    Callers hold a slot from acquire() to release(). While the moving average
+    of recent portal latencies stays within target_latency_ms the limit grows
+    by alpha per successful call; a latency breach, 429 or 5xx multiplies it
+    by beta. The limit always stays within [min_limit, max_limit].
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        window: int = 32,
+        target_latency_ms: float = 2000.0,
+    ):
+        """
+        Initialize controller
+
+        Args:
+            alpha: Additive increase per successful call
+            beta: Multiplicative decrease factor on overload
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            window: Number of recent latencies in the moving average
+            target_latency_ms: Average latency above which the limit backs off
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency_ms = target_latency_ms
+        self.limit = float(min_limit)
+        self.in_flight = 0
+        self.latencies: deque = deque(maxlen=window)
+        self.decreases = 0
+        self.condition = threading.Condition()
+        logger.debug(
+            f"AIMDController initialized: limit={min_limit}..{max_limit}, "
+            f"target={target_latency_ms}ms"
+        )
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot under the current limit
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a slot was acquired, False on timeout
+        """
+        with self.condition:
+            acquired = self.condition.wait_for(
+                lambda: self.in_flight < int(self.limit), timeout=timeout
+            )
+            if acquired:
+                self.in_flight += 1
+            return acquired
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()"""
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def on_success(self, latency_ms: float) -> None:
+        """
+        Record a successful portal call
+
+        Args:
+            latency_ms: Duration of the call in milliseconds
+        """
+        with self.condition:
+            self.latencies.append(latency_ms)
+            average = sum(self.latencies) / len(self.latencies)
+            if average <= self.target_latency_ms:
+                old_limit = int(self.limit)
+                self.limit = min(self.max_limit, self.limit + self.alpha)
+                if int(self.limit) > old_limit:
+                    self.condition.notify(int(self.limit) - old_limit)
+            else:
+                self._decrease(f"average latency {average:.0f}ms")
+
+    def on_error(self, status_code: Optional[int] = None) -> None:
+        """
+        Record a failed portal call
+
+        Args:
+            status_code: HTTP status, or None for connection errors/timeouts
+        """
+        if status_code is not None and status_code != 429 and status_code < 500:
+            return
+        with self.condition:
+            self._decrease(f"status {status_code or 'connection error'}")
+
+    def _decrease(self, reason: str) -> None:
+        """Back off multiplicatively (caller holds the condition)"""
+        self.limit = max(self.min_limit, self.limit * self.beta)
+        self.decreases += 1
+        # Judge the new limit on fresh samples only
+        self.latencies.clear()
+        logger.warning(f"PPB concurrency reduced to {int(self.limit)} ({reason})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get controller statistics
+
+        Returns:
+            Dictionary with current limit and load
+        """
+        with self.condition:
+            average = sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+            return {
+                "concurrency_limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "avg_latency_ms": round(average, 2),
+                "concurrency_decreases": self.decreases,
+            }
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer header, None if missing or malformed"""
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: Optional[str], now: float) -> Optional[float]:
+    """Parse Retry-After (delta-seconds or HTTP-date) into an absolute time"""
+    if not value:
+        return None
+    try:
+        return now + float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
 
-        if elapsed < self.delay:
-            wait_time = (self.delay - elapsed) + random.uniform(0, 0.05)  # Add small jitter
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
 
-        self.last_request = time.time()
+def _parse_reset(value: Optional[str], now: float) -> Optional[float]:
+    """Parse X-RateLimit-Reset (epoch seconds or seconds from now) into an absolute time"""
+    try:
+        reset = float(value) if value is not None else None
+    except ValueError:
+        return None
+    if reset is None:
+        return None
+    # Small values are relative windows, large ones Unix timestamps
+    return reset if reset > 1e9 else now + reset
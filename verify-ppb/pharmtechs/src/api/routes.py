@@ -2,24 +2,110 @@
 API routes for PPB pharmtech license verification
 """
 
-from flask import Blueprint, request, jsonify, current_app
-from datetime import datetime
+import json
+import logging
+from datetime import datetime, timezone
+
+from flask import Blueprint, request, current_app
 from pydantic import ValidationError
 
-from ..models.schemas import VerifyRequest, VerifyResponse
-from ..services.ppb_service import PPBService
-from ..core.logger import get_logger, set_correlation_id, get_correlation_id
+from ..models.schemas import VerifyRequest, VerifyBatchRequest, VerifyResponse
+from ..services.ppb_service import PPBService, ServiceBusyError
+from ..core.logger import get_logger, set_correlation_id, get_correlation_id, set_request_context
 from ..core.version import __version__
 
+try:
+    import orjson
+except ImportError:  # Optional speedup - falls back to stdlib json
+    orjson = None
+
 logger = get_logger(__name__)
 
 # Create blueprint
 api_bp = Blueprint("api", __name__)
 
+# Probe endpoints polled every few seconds; their start/completed lines are not logged
+_PROBE_PATHS = frozenset(("/health", "/ready"))
+
 # Service instance (will be initialized in create_app)
 _ppb_service = None
 
 
+def _json_default(obj):
+    """Serialize datetimes the way orjson does with OPT_UTC_Z (stdlib fallback)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Encode a payload as JSON bytes (orjson when available; datetimes become ISO-8601, UTC as Z)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_UTC_Z)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def _json_response(obj, status: int = 200):
+    """
+    Build a JSON response, encoded with orjson when available
+
+    Args:
+        obj: JSON-serializable payload, or bytes already encoded with _dumps
+        status: HTTP status code
+
+    Returns:
+        Flask response
+    """
+    body = obj if isinstance(obj, bytes) else _dumps(obj)
+    return current_app.response_class(body, status=status, mimetype="application/json")
+
+
+# Static payloads, encoded once at import
+_INDEX_BODY = _dumps({
+    "service": "PPB PharmTech License Verification Microservice",
+    "version": __version__,
+    "description": "Verify Kenya PPB pharmaceutical technician licenses with complete details",
+    "endpoints": {
+        "info": "GET /",
+        "health": "GET /health",
+        "ready": "GET /ready",
+        "verify": "POST /verify",
+        "verify_batch": "POST /verify/batch",
+        "cache_stats": "GET /cache/stats",
+        "cache_clear": "DELETE /cache"
+    }
+})
+_READY_BODY = _dumps({
+    "status": "ready",
+    "version": __version__,
+})
+_NOT_READY_BODY = _dumps({
+    "status": "not_ready",
+    "message": "Service not initialized"
+})
+
+
+def _validation_message(exc: ValidationError) -> str:
+    """First validation error as a client-facing message (license pattern spelled out)"""
+    errors = exc.errors()
+    if not errors:
+        return "Invalid request"
+    if errors[0]['type'] == "string_pattern_mismatch":
+        return "Invalid license number format. Expected format: PTYYYYXNNNNN (e.g., PT2025D05614)"
+    return errors[0]['msg']
+
+
+def _busy_response(exc: ServiceBusyError):
+    """503 telling the client to retry once a portal slot frees up"""
+    response = _json_response({
+        "success": False,
+        "message": str(exc),
+        "data": None
+    }, 503)
+    response.headers["Retry-After"] = "1"
+    return response
+
+
 def init_service(app):
     """
     Initialize PPB service with app configuration
@@ -42,17 +128,19 @@ def init_service(app):
 @api_bp.before_request
 def before_request():
     """Set up request context (correlation ID, logging)"""
-    # Generate and set correlation ID
-    corr_id = request.headers.get("X-Correlation-ID") or set_correlation_id()
-
-    logger.info(
-        f"Request started",
-        extra={"extra_data": {
-            "method": request.method,
-            "path": request.path,
-            "remote_addr": request.remote_addr,
-        }}
-    )
+    # Use the caller's correlation ID, or generate one
+    set_correlation_id(request.headers.get("X-Correlation-ID"))
+
+    # Captured once; the JSON formatter attaches it to every record of this request
+    req_ctx = {
+        "method": request.method,
+        "path": request.path,
+        "remote_addr": request.remote_addr,
+    }
+    set_request_context(req_ctx)
+
+    if req_ctx["path"] not in _PROBE_PATHS and logger.isEnabledFor(logging.INFO):
+        logger.info("Request started", extra={"extra_data": req_ctx})
 
 
 @api_bp.after_request
@@ -62,29 +150,24 @@ def after_request(response):
     if corr_id:
         response.headers["X-Correlation-ID"] = corr_id
 
-    logger.info(
-        f"Request completed",
-        extra={"extra_data": {"status_code": response.status_code}}
-    )
+    if request.path not in _PROBE_PATHS and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Request completed",
+            extra={"extra_data": {"status_code": response.status_code}}
+        )
     return response
 
 
+@api_bp.teardown_request
+def teardown_request(exc):
+    """Clear per-request logging context so reused worker threads don't carry it over"""
+    set_request_context(None)
+
+
 @api_bp.route("/", methods=["GET"])
 def index():
     """Root endpoint with API information"""
-    return jsonify({
-        "service": "PPB PharmTech License Verification Microservice",
-        "version": __version__,
-        "description": "Verify Kenya PPB pharmaceutical technician licenses with complete details",
-        "endpoints": {
-            "info": "GET /",
-            "health": "GET /health",
-            "ready": "GET /ready",
-            "verify": "POST /verify",
-            "cache_stats": "GET /cache/stats",
-            "cache_clear": "DELETE /cache"
-        }
-    }), 200
+    return _json_response(_INDEX_BODY, 200)
 
 
 @api_bp.route("/health", methods=["GET"])
@@ -92,27 +175,21 @@ def health_check():
     """Health check endpoint with cache stats"""
     cache_stats = _ppb_service.get_cache_stats() if _ppb_service else {"cache_enabled": False}
 
-    return jsonify({
+    return _json_response({
         "status": "healthy",
         "version": __version__,
-        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": datetime.now(timezone.utc).replace(microsecond=0),
         "cache": cache_stats
-    }), 200
+    }, 200)
 
 
 @api_bp.route("/ready", methods=["GET"])
 def readiness_check():
     """Readiness check endpoint for Kubernetes/production"""
     if _ppb_service is None:
-        return jsonify({
-            "status": "not_ready",
-            "message": "Service not initialized"
-        }), 503
+        return _json_response(_NOT_READY_BODY, 503)
 
-    return jsonify({
-        "status": "ready",
-        "version": __version__,
-    }), 200
+    return _json_response(_READY_BODY, 200)
 
 
 @api_bp.route("/verify", methods=["POST"])
@@ -145,17 +222,17 @@ def verify_license():
     """
     # Validate content type
     if not request.is_json:
-        return jsonify({
+        return _json_response({
             "success": False,
             "message": "Content-Type must be application/json",
             "data": None
-        }), 400
+        }, 400)
 
     try:
-        # Validate and parse request
-        payload = VerifyRequest(**request.get_json())
+        # Decode and validate the body in one pydantic-core pass
+        payload = VerifyRequest.model_validate_json(request.get_data(cache=True))
 
-        logger.info(f"Verifying license: {payload.license_number}")
+        logger.info("Verifying license: %s", payload.license_number)
 
         # Perform verification
         result = _ppb_service.verify_license_detailed(
@@ -166,52 +243,120 @@ def verify_license():
         # Return appropriate status code
         status_code = 200 if result.get("success") else 404
 
-        return jsonify(result), status_code
+        return _json_response(result, status_code)
 
+    except ServiceBusyError as e:
+        return _busy_response(e)
     except ValidationError as e:
-        errors = e.errors()
-        error_msg = errors[0]['msg'] if errors else "Invalid request"
+        error_msg = _validation_message(e)
         logger.warning(f"Validation error: {error_msg}")
-        return jsonify({
+        return _json_response({
             "success": False,
             "message": f"Validation error: {error_msg}",
             "data": None
-        }), 400
+        }, 400)
     except Exception as e:
         logger.error(f"Unexpected error in verify endpoint: {str(e)}", exc_info=True)
-        return jsonify({
+        return _json_response({
+            "success": False,
+            "message": "Internal server error",
+            "data": None
+        }, 500)
+
+
+@api_bp.route("/verify/batch", methods=["POST"])
+def verify_batch():
+    """
+    Verify several pharmtech licenses in one request
+
+    Request body:
+    {
+        "license_numbers": ["PT2025D05614", "PT2024B01234"],
+        "use_cache": true  // optional, defaults to true
+    }
+
+    Response: one result per license number, in request order, each shaped
+    like the /verify response
+    {
+        "success": true,
+        "count": 2,
+        "results": [...]
+    }
+    """
+    if not request.is_json:
+        return _json_response({
+            "success": False,
+            "message": "Content-Type must be application/json",
+            "data": None
+        }, 400)
+
+    try:
+        payload = VerifyBatchRequest.model_validate_json(request.get_data(cache=True))
+
+        max_batch = current_app.config.get("MAX_BATCH_SIZE", 100)
+        if len(payload.license_numbers) > max_batch:
+            return _json_response({
+                "success": False,
+                "message": f"Validation error: at most {max_batch} license numbers per batch",
+                "data": None
+            }, 400)
+
+        logger.info("Verifying batch of %s licenses", len(payload.license_numbers))
+
+        results = _ppb_service.verify_license_detailed_many(
+            payload.license_numbers,
+            use_cache=payload.use_cache
+        )
+
+        return _json_response({
+            "success": all(r.get("success") for r in results),
+            "count": len(results),
+            "results": results
+        }, 200)
+
+    except ValidationError as e:
+        error_msg = _validation_message(e)
+        logger.warning(f"Validation error: {error_msg}")
+        return _json_response({
+            "success": False,
+            "message": f"Validation error: {error_msg}",
+            "data": None
+        }, 400)
+    except Exception as e:
+        logger.error(f"Unexpected error in batch verify endpoint: {str(e)}", exc_info=True)
+        return _json_response({
             "success": False,
             "message": "Internal server error",
             "data": None
-        }), 500
+        }, 500)
 
 
 @api_bp.route("/cache/stats", methods=["GET"])
 def cache_stats():
     """Get cache statistics"""
     stats = _ppb_service.get_cache_stats() if _ppb_service else {"cache_enabled": False}
-    return jsonify(stats), 200
+    return _json_response(stats)
 
 
 @api_bp.route("/cache", methods=["DELETE"])
 def clear_cache():
     """Clear all cache entries"""
     if not _ppb_service:
-        return jsonify({
+        return _json_response({
             "success": False,
             "message": "Service not initialized"
-        }), 500
+        }, 500)
 
     success = _ppb_service.clear_cache()
 
     if success:
         logger.info("Cache cleared via API")
-        return jsonify({
+        return _json_response({
             "success": True,
             "message": "Cache cleared successfully"
-        }), 200
+        }, 200)
     else:
-        return jsonify({
+        return _json_response({
             "success": False,
             "message": "Cache not enabled"
-        }), 400
+        }, 400)
@@ -56,12 +56,5 @@ def create_app(config_name=None):
     return app
 
 
-# Create app instance for direct execution
+# App instance served by Gunicorn (src.app:app); see run.py for local runs
 app = create_app()
-
-if __name__ == "__main__":
-    app.run(
-        debug=app.config.get("DEBUG", False),
-        host=app.config.get("HOST", "0.0.0.0"),
-        port=app.config.get("PORT", 5001),
-    )
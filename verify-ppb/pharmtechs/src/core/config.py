@@ -25,14 +25,26 @@ class Config:
     REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT", "15"))
     MAX_RETRIES = int(os.environ.get("MAX_RETRIES", "2"))
     RETRY_BACKOFF = float(os.environ.get("RETRY_BACKOFF", "0.3"))
+    HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", "64"))  # keep-alive connections per host
 
     # Rate Limiting (CRITICAL - prevents IP blocking)
     RATE_LIMIT_DELAY = float(os.environ.get("RATE_LIMIT_DELAY", "1.5"))
 
+    # Adaptive concurrency (AIMD) for portal calls
+    PPB_MIN_CONCURRENCY = int(os.environ.get("PPB_MIN_CONCURRENCY", "1"))
+    PPB_MAX_CONCURRENCY = int(os.environ.get("PPB_MAX_CONCURRENCY", "16"))
+    PPB_TARGET_LATENCY_MS = float(os.environ.get("PPB_TARGET_LATENCY_MS", "2000"))
+    ADMISSION_TIMEOUT = float(os.environ.get("ADMISSION_TIMEOUT", "30"))  # seconds to wait for a slot
+
+    # Batch verification
+    MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "100"))
+    BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "4"))
+
     # Caching Configuration
     CACHE_ENABLED = os.environ.get("CACHE_ENABLED", "true").lower() == "true"
     CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "simple")  # 'simple' or 'redis'
     CACHE_TTL = int(os.environ.get("CACHE_TTL", "3600"))  # 1 hour default
+    NEGATIVE_CACHE_TTL = int(os.environ.get("NEGATIVE_CACHE_TTL", "60"))  # "not found" results
     CACHE_MAX_SIZE = int(os.environ.get("CACHE_MAX_SIZE", "1000"))
     REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/1")  # Different DB from facilities
 
@@ -56,6 +68,7 @@ class ProductionConfig(Config):
     """Production configuration with optimized settings"""
     DEBUG = False
     CACHE_TTL = 7200  # 2 hours for production
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "redis")  # shared by all Gunicorn workers
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "json"
 
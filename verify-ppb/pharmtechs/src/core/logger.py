@@ -10,11 +10,13 @@ import uuid
 from datetime import datetime
 from typing import Optional
 from contextvars import ContextVar
-from flask import has_request_context, request
 
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
+# Request fields (method, path, remote_addr), captured once per request
+request_context: ContextVar[Optional[dict]] = ContextVar("request_context", default=None)
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
@@ -36,12 +38,9 @@ class JSONFormatter(logging.Formatter):
             log_data["correlation_id"] = corr_id
 
         # Add request context if available
-        if has_request_context():
-            log_data["request"] = {
-                "method": request.method,
-                "path": request.path,
-                "remote_addr": request.remote_addr,
-            }
+        req_ctx = request_context.get()
+        if req_ctx:
+            log_data["request"] = req_ctx
 
         # Add exception info if present
         if record.exc_info:
@@ -126,3 +125,13 @@ def set_correlation_id(corr_id: Optional[str] = None):
 def get_correlation_id() -> Optional[str]:
     """Get current correlation ID"""
     return correlation_id.get()
+
+
+def set_request_context(ctx: Optional[dict]):
+    """
+    Set the request fields attached to log records
+
+    Args:
+        ctx: Dict of request fields, or None outside a request
+    """
+    request_context.set(ctx)
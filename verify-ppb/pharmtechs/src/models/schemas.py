@@ -3,14 +3,22 @@ Pydantic models for request/response validation
 Provides automatic validation, serialization, and OpenAPI schema generation
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+# PharmTech license number, e.g. PT2025D05614 - stripped, upper-cased and
+# matched inside pydantic-core instead of a Python-level validator.
+# to_upper is applied after the pattern check, so the pattern is case-insensitive
+LICENSE_NUMBER_PATTERN = r"(?i)^PT\d{4}[A-Z]\d{5}$"
+LicenseNumber = Annotated[
+    str, StringConstraints(strip_whitespace=True, to_upper=True, pattern=LICENSE_NUMBER_PATTERN)
+]
 
 
 class VerifyRequest(BaseModel):
     """Request model for pharmtech license verification"""
 
-    license_number: str = Field(
+    license_number: LicenseNumber = Field(
         ...,
         min_length=10,
         max_length=20,
@@ -22,11 +30,20 @@ class VerifyRequest(BaseModel):
         description="Whether to use cached results if available",
     )
 
-    @field_validator("license_number")
-    @classmethod
-    def normalize_license_number(cls, v: str) -> str:
-        """Normalize license number by stripping whitespace and converting to uppercase"""
-        return v.strip().upper()
+
+class VerifyBatchRequest(BaseModel):
+    """Request model for verifying several pharmtech licenses in one call"""
+
+    license_numbers: List[LicenseNumber] = Field(
+        ...,
+        min_length=1,
+        description="PharmTech license numbers to verify",
+        examples=[["PT2025D05614", "PT2024B01234"]],
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to use cached results if available",
+    )
 
 
 class PharmTechData(BaseModel):
@@ -50,6 +67,9 @@ class VerifyResponse(BaseModel):
     message: str = Field(..., description="Human-readable message about the result")
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
     from_cache: bool = Field(..., description="Whether result was served from cache")
+    not_found: bool = Field(
+        False, description="Whether the license is absent from the registry"
+    )
     data: Optional[PharmTechData] = Field(
         None, description="PharmTech data (null if verification failed)"
     )
@@ -11,12 +11,15 @@ CRITICAL: This follows the same pattern as facilities service but with:
 
 import re
 import time
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
 
+import requests
+
 from ..core.config import Config
 from ..core.logger import get_logger
-from ..adapters.http import build_session, RateLimiter
+from ..adapters.http import build_session, RateLimiter, AIMDController
 from ..adapters.cache_redis import get_cache
 
 logger = get_logger(__name__)
@@ -32,6 +35,11 @@ class PharmTechNotFoundError(PPBVerificationError):
     pass
 
 
+class ServiceBusyError(PPBVerificationError):
+    """Raised when no portal concurrency slot frees up in time"""
+    pass
+
+
 class PPBService:
     """PPB pharmtech license verification service"""
 
@@ -66,7 +74,8 @@ class PPBService:
         # Session with retry logic
         self.session = build_session(
             max_retries=self.max_retries,
-            backoff=Config.RETRY_BACKOFF
+            backoff=Config.RETRY_BACKOFF,
+            pool_maxsize=Config.HTTP_POOL_MAXSIZE
         )
 
         # Search headers - for POST search request
@@ -99,6 +108,13 @@ class PPBService:
         delay = rate_limit_delay if rate_limit_delay is not None else Config.RATE_LIMIT_DELAY
         self.rate_limiter = RateLimiter(delay=delay)
 
+        # Concurrency limit that backs off when PPB slows down or errors
+        self.concurrency = AIMDController(
+            min_limit=Config.PPB_MIN_CONCURRENCY,
+            max_limit=Config.PPB_MAX_CONCURRENCY,
+            target_latency_ms=Config.PPB_TARGET_LATENCY_MS,
+        )
+
         # Cache setup
         self.use_cache = use_cache and Config.CACHE_ENABLED
         if cache_ttl is None:
@@ -164,17 +180,24 @@ class PPBService:
         }
 
         try:
-            logger.debug(f"Searching PPB portal for: {license_number}")
+            logger.debug("Searching PPB portal for: %s", license_number)
+            request_start = time.perf_counter()
             response = self.session.post(
                 self.ppb_search_url,
                 data=payload,
                 headers=self.search_headers,
                 timeout=self.timeout
             )
+            self._record_response(response, request_start)
             response.raise_for_status()
-            logger.debug(f"Search successful for: {license_number}")
+            logger.debug("Search successful for: %s", license_number)
             return response.text
 
+        except requests.RequestException as e:
+            if e.response is None:
+                self.concurrency.on_error()
+            logger.error(f"Search failed for {license_number}: {str(e)}")
+            raise PPBVerificationError(f"Failed to connect to PPB portal: {str(e)}")
         except Exception as e:
             logger.error(f"Search failed for {license_number}: {str(e)}")
             raise PPBVerificationError(f"Failed to connect to PPB portal: {str(e)}")
@@ -195,7 +218,7 @@ class PPBService:
         id_match = re.search(r"rel='([^']+)'", html)
         if id_match:
             pharmtech_id = id_match.group(1)
-            logger.debug(f"Extracted pharmtech ID: {pharmtech_id}")
+            logger.debug("Extracted pharmtech ID: %s", pharmtech_id)
             return pharmtech_id
 
         return None
@@ -260,19 +283,24 @@ class PPBService:
         }
 
         try:
-            logger.debug(f"Fetching details for pharmtech ID: {pharmtech_id}")
+            logger.debug("Fetching details for pharmtech ID: %s", pharmtech_id)
+            request_start = time.perf_counter()
             response = self.session.get(
                 self.ppb_search_url,
                 params=params,
                 headers=self.details_headers,
                 timeout=self.timeout
             )
+            self._record_response(response, request_start)
 
             if response.status_code == 200:
                 html = response.text
                 logger.debug("Details retrieved successfully")
                 return html
 
+        except requests.RequestException as e:
+            self.concurrency.on_error()
+            logger.error(f"Failed to get details for pharmtech ID {pharmtech_id}: {str(e)}")
         except Exception as e:
             logger.error(f"Failed to get details for pharmtech ID {pharmtech_id}: {str(e)}")
 
@@ -326,6 +354,14 @@ class PPBService:
 
         return info
 
+    def _record_response(self, response: requests.Response, request_start: float) -> None:
+        """Feed a portal response to the rate limiter and concurrency controller"""
+        self.rate_limiter.update_from_response(response)
+        if response.status_code == 429 or response.status_code >= 500:
+            self.concurrency.on_error(response.status_code)
+        else:
+            self.concurrency.on_success((time.perf_counter() - request_start) * 1000)
+
     def verify_license_detailed(self, license_number: str, use_cache: bool = True) -> Dict:
         """
         Complete two-step verification with all detailed data
@@ -340,6 +376,10 @@ class PPBService:
 
         Returns:
             Complete verification result with all fields
+
+        Raises:
+            ServiceBusyError: If no concurrency slot frees up within
+                Config.ADMISSION_TIMEOUT
         """
         start_time = time.time()
 
@@ -349,7 +389,7 @@ class PPBService:
                 raise PPBVerificationError("Invalid license number format")
 
             license_number = license_number.strip().upper()
-            logger.info(f"Verifying PharmTech license: {license_number}")
+            logger.info("Verifying PharmTech license: %s", license_number)
 
             # Validate format
             if not self.validate_license_format(license_number):
@@ -357,75 +397,58 @@ class PPBService:
                     "Invalid license number format. Expected format: PTYYYYXNNNNN (e.g., PT2025D05614)"
                 )
 
-            # Check cache
+            # Check cache (keys use the normalized license number)
             cache_key = f"detailed:{license_number}"
             if use_cache and self.use_cache:
                 cached_result = self.cache.get(cache_key)
                 if cached_result is not None:
-                    cached_result['from_cache'] = True
-                    logger.info(f"Cache hit for: {license_number}")
-                    return cached_result
-
-            # STEP 1: Search for pharmtech
-            search_html = self.search_pharmtech(license_number)
-
-            if not search_html or "No records found" in search_html:
-                raise PharmTechNotFoundError(
-                    f"PharmTech license '{license_number}' not found in registry"
-                )
-
-            # Extract pharmtech ID
-            pharmtech_id = self.extract_pharmtech_id(search_html)
-
-            # If the search succeeded but no ID was found, treat as not found
-            if not pharmtech_id:
-                raise PharmTechNotFoundError(
-                    f"PharmTech license '{license_number}' not found in registry"
-                )
-
-            # Extract basic data from search results
-            search_data = self.extract_search_data(search_html)
-
-            # STEP 2: Get detailed data
-            detailed_html = self.get_pharmtech_details(pharmtech_id)
-
-            if not detailed_html:
-                raise PPBVerificationError("Failed to retrieve detailed pharmtech information")
-
-            # STEP 3: Parse detailed data
-            detailed_info = self.parse_detailed_html(detailed_html)
-
-            # Merge search and detailed data (detailed takes precedence)
-            final_data = {**search_data, **detailed_info}
-
-            if not final_data.get('practice_license_number') and not final_data.get('license_number'):
-                raise PPBVerificationError("Failed to extract complete pharmtech information")
-
-            # Add metadata
-            final_data['verified_at'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+                    logger.info("Cache hit for: %s", license_number)
+                    return {
+                        **cached_result,
+                        "from_cache": True,
+                        "processing_time_ms": round((time.time() - start_time) * 1000, 2)
+                    }
+
+                # Recently confirmed "not found" licenses skip the portal entirely
+                negative_result = self.cache.get(f"negative:{license_number}")
+                if negative_result is not None:
+                    logger.info("Negative cache hit for: %s", license_number)
+                    return {
+                        **negative_result,
+                        "from_cache": True,
+                        "processing_time_ms": round((time.time() - start_time) * 1000, 2)
+                    }
+
+            if not self.concurrency.acquire(timeout=Config.ADMISSION_TIMEOUT):
+                raise ServiceBusyError("PPB portal is busy, please retry shortly")
+            try:
+                return self._verify_uncached(license_number, use_cache, cache_key, start_time)
+            finally:
+                self.concurrency.release()
 
+        except PharmTechNotFoundError as e:
             processing_time = round((time.time() - start_time) * 1000, 2)
-
+            logger.warning(f"PharmTech not found: {license_number}")
             result = {
-                "success": True,
+                "success": False,
                 "license_number": license_number,
-                "message": "PharmTech verification successful",
+                "message": str(e),
                 "processing_time_ms": processing_time,
                 "from_cache": False,
-                "data": final_data
+                "not_found": True,
+                "data": None
             }
 
-            # Cache result
+            # Remember the miss briefly so retries of a mistyped license don't hit PPB
             if use_cache and self.use_cache:
-                self.cache.set(cache_key, result, self.cache_ttl)
-                logger.debug(f"Cached result for: {license_number}")
+                self.cache.set(f"negative:{license_number}", dict(result), Config.NEGATIVE_CACHE_TTL)
 
-            logger.info(f"Verification successful for {license_number} in {processing_time}ms")
             return result
-
-        except PharmTechNotFoundError as e:
+        except ServiceBusyError:
+            raise
+        except PPBVerificationError as e:
             processing_time = round((time.time() - start_time) * 1000, 2)
-            logger.warning(f"PharmTech not found: {license_number}")
+            logger.error(f"Verification error for {license_number}: {str(e)}")
             return {
                 "success": False,
                 "license_number": license_number,
@@ -434,25 +457,157 @@ class PPBService:
                 "from_cache": False,
                 "data": None
             }
-        except PPBVerificationError as e:
+        except Exception as e:
             processing_time = round((time.time() - start_time) * 1000, 2)
-            logger.error(f"Verification error for {license_number}: {str(e)}")
+            logger.error(f"Unexpected error for {license_number}: {str(e)}", exc_info=True)
             return {
                 "success": False,
                 "license_number": license_number,
-                "message": str(e),
+                "message": f"Unexpected error: {str(e)}",
                 "processing_time_ms": processing_time,
                 "from_cache": False,
                 "data": None
             }
-        except Exception as e:
-            processing_time = round((time.time() - start_time) * 1000, 2)
-            logger.error(f"Unexpected error for {license_number}: {str(e)}", exc_info=True)
+
+    def _verify_uncached(
+        self, license_number: str, use_cache: bool, cache_key: str, start_time: float
+    ) -> Dict:
+        """Run the portal steps of verify_license_detailed while holding a concurrency slot"""
+        # STEP 1: Search for pharmtech
+        search_html = self.search_pharmtech(license_number)
+
+        if not search_html or "No records found" in search_html:
+            raise PharmTechNotFoundError(
+                f"PharmTech license '{license_number}' not found in registry"
+            )
+
+        # Extract pharmtech ID
+        pharmtech_id = self.extract_pharmtech_id(search_html)
+
+        # If the search succeeded but no ID was found, treat as not found
+        if not pharmtech_id:
+            raise PharmTechNotFoundError(
+                f"PharmTech license '{license_number}' not found in registry"
+            )
+
+        # Extract basic data from search results
+        search_data = self.extract_search_data(search_html)
+
+        # STEP 2: Get detailed data
+        detailed_html = self.get_pharmtech_details(pharmtech_id)
+
+        if not detailed_html:
+            raise PPBVerificationError("Failed to retrieve detailed pharmtech information")
+
+        # STEP 3: Parse detailed data
+        detailed_info = self.parse_detailed_html(detailed_html)
+
+        # Merge search and detailed data (detailed takes precedence)
+        final_data = {**search_data, **detailed_info}
+
+        if not final_data.get('practice_license_number') and not final_data.get('license_number'):
+            raise PPBVerificationError("Failed to extract complete pharmtech information")
+
+        # Add metadata
+        final_data['verified_at'] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        processing_time = round((time.time() - start_time) * 1000, 2)
+
+        result = {
+            "success": True,
+            "license_number": license_number,
+            "message": "PharmTech verification successful",
+            "processing_time_ms": processing_time,
+            "from_cache": False,
+            "data": final_data
+        }
+
+        # Cache result
+        if use_cache and self.use_cache:
+            self.cache.set(cache_key, result, self.cache_ttl)
+            logger.debug("Cached result for: %s", license_number)
+
+        logger.info("Verification successful for %s in %sms", license_number, processing_time)
+        return result
+
+    def verify_license_detailed_many(self, license_numbers: List[str], use_cache: bool = True) -> List[Dict]:
+        """
+        Verify several pharmtech licenses concurrently
+
+        Cached entries (including recent "not found" results) are read with a
+        single get_many call; each distinct miss is then verified once on a
+        small thread pool, so portal round trips overlap while the shared
+        rate limiter and concurrency controller still govern every request,
+        and the fresh results are written back with set_many. A miss that
+        gets no concurrency slot in time fails on its own; the rest of the
+        batch is still returned and cached.
+
+        Args:
+            license_numbers: PharmTech license numbers
+            use_cache: Whether to use cache
+
+        Returns:
+            Verification results in the same order as license_numbers
+        """
+        start_time = time.time()
+        numbers = [n.strip().upper() if isinstance(n, str) else n for n in license_numbers]
+        results: List[Optional[Dict]] = [None] * len(numbers)
+        caching = use_cache and self.use_cache
+
+        if caching:
+            cached = self.cache.get_many(
+                [f"detailed:{n}" for n in numbers] + [f"negative:{n}" for n in numbers]
+            )
+            positive, negative = cached[:len(numbers)], cached[len(numbers):]
+            lookup_time = round((time.time() - start_time) * 1000, 2)
+            for idx, cached_result in enumerate(positive):
+                cached_result = cached_result if cached_result is not None else negative[idx]
+                if cached_result is not None:
+                    results[idx] = {
+                        **cached_result,
+                        "from_cache": True,
+                        "processing_time_ms": lookup_time
+                    }
+
+        # Each distinct miss is fetched once, even if repeated in the batch
+        misses = list(dict.fromkeys(n for n, r in zip(numbers, results) if r is None))
+        if misses:
+            logger.info("Batch verification: %s cached, %s to fetch", len(numbers) - len(misses), len(misses))
+            workers = max(1, min(len(misses), Config.BATCH_MAX_WORKERS))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ppb-batch") as executor:
+                fetched = dict(zip(
+                    misses,
+                    executor.map(self._verify_batch_entry, misses)
+                ))
+
+            if caching:
+                to_cache = {
+                    f"detailed:{n}": result for n, result in fetched.items() if result.get("success")
+                }
+                if to_cache:
+                    self.cache.set_many(to_cache, self.cache_ttl)
+
+                not_found = {
+                    f"negative:{n}": result for n, result in fetched.items() if result.get("not_found")
+                }
+                if not_found:
+                    self.cache.set_many(not_found, Config.NEGATIVE_CACHE_TTL)
+
+            results = [r if r is not None else fetched[n] for n, r in zip(numbers, results)]
+
+        return results
+
+    def _verify_batch_entry(self, license_number: str) -> Dict:
+        """Verify one batch miss, reporting a busy portal as a failed result"""
+        start_time = time.time()
+        try:
+            return self.verify_license_detailed(license_number, use_cache=False)
+        except ServiceBusyError as e:
             return {
                 "success": False,
                 "license_number": license_number,
-                "message": f"Unexpected error: {str(e)}",
-                "processing_time_ms": processing_time,
+                "message": str(e),
+                "processing_time_ms": round((time.time() - start_time) * 1000, 2),
                 "from_cache": False,
                 "data": None
             }
@@ -460,10 +615,11 @@ class PPBService:
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
         if not self.use_cache or self.cache is None:
-            return {"cache_enabled": False}
+            return {"cache_enabled": False, **self.concurrency.get_stats()}
 
         stats = self.cache.get_stats()
         stats['cache_enabled'] = True
+        stats.update(self.concurrency.get_stats())
         return stats
 
     def clear_cache(self) -> bool:
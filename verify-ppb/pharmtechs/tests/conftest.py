@@ -3,8 +3,10 @@ Pytest configuration and shared fixtures
 Provides test data, fixtures, and utilities for the test suite
 """
 
+import threading
+
 import pytest
-from src.services.ppb_service import PPBService
+from src.services.ppb_service import PPBService, PharmTechNotFoundError
 
 
 # Real test data from PPB portal
@@ -84,6 +86,40 @@ def cached_service():
     )
 
 
+@pytest.fixture
+def fake_portal(cached_service, monkeypatch):
+    """
+    Answer cached_service's portal round trips in memory
+
+    Replaces _verify_uncached, so cache lookups, the concurrency controller
+    and batching still run for real. ERROR_TEST_CASES[0] is not found.
+
+    Returns:
+        List of license numbers sent to the (fake) portal
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def verify_uncached(license_number, use_cache, cache_key, start_time):
+        with lock:
+            calls.append(license_number)
+        if license_number == ERROR_TEST_CASES[0]["license_number"]:
+            raise PharmTechNotFoundError(
+                f"PharmTech license '{license_number}' not found in registry"
+            )
+        return {
+            "success": True,
+            "license_number": license_number,
+            "message": "PharmTech verification successful",
+            "processing_time_ms": 1500.0,
+            "from_cache": False,
+            "data": {"practice_license_number": license_number}
+        }
+
+    monkeypatch.setattr(cached_service, "_verify_uncached", verify_uncached)
+    return calls
+
+
 @pytest.fixture
 def real_test_cases():
     """Provide real test cases for verification"""
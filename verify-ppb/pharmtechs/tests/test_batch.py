@@ -0,0 +1,68 @@
+"""
+Batch Verification Tests
+Tests the pharmtechs-specific parts of verify_license_detailed_many (no portal access needed)
+"""
+
+import pytest
+
+from tests.conftest import ERROR_TEST_CASES
+
+UNKNOWN_LICENSE = ERROR_TEST_CASES[0]["license_number"]
+
+
+@pytest.mark.unit
+class TestBatchCacheHitTiming:
+    """Test that cache hits report the lookup time, not the stored portal time"""
+
+    def test_hits_report_lookup_time(self, cached_service, fake_portal):
+        """Test that a cached success does not replay its original processing time"""
+        cached_service.verify_license_detailed_many(["PT2025D00001"])
+
+        results = cached_service.verify_license_detailed_many(["PT2025D00001"])
+
+        assert fake_portal == ["PT2025D00001"]
+        assert results[0]["from_cache"] is True
+        assert results[0]["processing_time_ms"] < 1500.0
+
+    def test_hits_and_misses_timed_separately(self, cached_service, fake_portal):
+        """Test that a batch mixing hits and misses times each kind on its own"""
+        cached_service.verify_license_detailed_many([UNKNOWN_LICENSE])
+
+        results = cached_service.verify_license_detailed_many([UNKNOWN_LICENSE, "PT2025D00002"])
+
+        assert [r["from_cache"] for r in results] == [True, False]
+        assert results[0]["not_found"] is True
+        assert results[0]["processing_time_ms"] < 1500.0
+        assert results[1]["processing_time_ms"] == 1500.0
+
+
+@pytest.mark.unit
+class TestBatchBusy:
+    """Test misses that get no concurrency slot before ADMISSION_TIMEOUT"""
+
+    @pytest.fixture
+    def busy_service(self, cached_service, fake_portal, monkeypatch):
+        """cached_service whose concurrency controller never grants a slot"""
+        monkeypatch.setattr(cached_service.concurrency, "acquire", lambda timeout=None: False)
+        return cached_service
+
+    def test_busy_miss_fails_alone(self, busy_service, fake_portal):
+        """Test that cached entries are still returned next to a busy miss"""
+        busy_service.cache.set(
+            "detailed:PT2025D00001", {"success": True, "license_number": "PT2025D00001"}
+        )
+
+        results = busy_service.verify_license_detailed_many(["PT2025D00001", "PT2025D00002"])
+
+        assert results[0]["success"] is True
+        assert results[0]["from_cache"] is True
+        assert results[1]["success"] is False
+        assert "busy" in results[1]["message"].lower()
+        assert fake_portal == []
+
+    def test_busy_miss_not_cached(self, busy_service, fake_portal):
+        """Test that a busy result is neither cached nor negative-cached"""
+        busy_service.verify_license_detailed_many(["PT2025D00002"])
+
+        assert busy_service.cache.get("detailed:PT2025D00002") is None
+        assert busy_service.cache.get("negative:PT2025D00002") is None
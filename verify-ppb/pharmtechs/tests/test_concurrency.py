@@ -0,0 +1,133 @@
+"""
+Concurrency Control Tests
+Tests the AIMD concurrency limit and the busy response (no portal access needed)
+"""
+
+import pytest
+
+from src.adapters.http import AIMDController
+from src.app import create_app
+from src.api import routes
+from src.services.ppb_service import ServiceBusyError
+
+
+@pytest.fixture
+def controller():
+    """Controller with a small range so bounds are reached quickly"""
+    return AIMDController(alpha=1.0, beta=0.5, min_limit=1, max_limit=4, target_latency_ms=100.0)
+
+
+@pytest.mark.unit
+class TestAIMDLimit:
+    """Test additive increase and multiplicative decrease"""
+
+    def test_starts_at_min_limit(self, controller):
+        """Test that the limit starts at min_limit"""
+        assert controller.get_stats()["concurrency_limit"] == 1
+
+    def test_fast_calls_increase_additively(self, controller):
+        """Test that each fast call adds alpha to the limit"""
+        controller.on_success(10)
+        controller.on_success(10)
+
+        assert controller.get_stats()["concurrency_limit"] == 3
+
+    def test_increase_capped_at_max_limit(self, controller):
+        """Test that the limit never exceeds max_limit"""
+        for _ in range(20):
+            controller.on_success(10)
+
+        assert controller.get_stats()["concurrency_limit"] == 4
+
+    def test_slow_calls_decrease_multiplicatively(self, controller):
+        """Test that a latency breach multiplies the limit by beta"""
+        for _ in range(3):
+            controller.on_success(10)
+        controller.on_success(10_000)
+
+        stats = controller.get_stats()
+        assert stats["concurrency_limit"] == 2
+        assert stats["concurrency_decreases"] == 1
+
+    def test_decrease_floored_at_min_limit(self, controller):
+        """Test that the limit never drops below min_limit"""
+        for _ in range(10):
+            controller.on_error(503)
+
+        assert controller.get_stats()["concurrency_limit"] == 1
+
+    @pytest.mark.parametrize("status_code", [429, 500, 503, None])
+    def test_overload_errors_decrease(self, controller, status_code):
+        """Test that 429, 5xx and connection errors back off"""
+        for _ in range(3):
+            controller.on_success(10)
+        controller.on_error(status_code)
+
+        assert controller.get_stats()["concurrency_limit"] == 2
+
+    def test_client_errors_ignored(self, controller):
+        """Test that other 4xx responses do not back off"""
+        for _ in range(3):
+            controller.on_success(10)
+        controller.on_error(404)
+
+        assert controller.get_stats()["concurrency_limit"] == 4
+        assert controller.get_stats()["concurrency_decreases"] == 0
+
+
+@pytest.mark.unit
+class TestAIMDSlots:
+    """Test acquiring and releasing slots"""
+
+    def test_acquire_times_out_at_limit(self, controller):
+        """Test that acquire fails once in_flight reaches the limit"""
+        assert controller.acquire(timeout=0.01) is True
+        assert controller.acquire(timeout=0.01) is False
+        assert controller.get_stats()["in_flight"] == 1
+
+    def test_release_frees_slot(self, controller):
+        """Test that a released slot can be acquired again"""
+        controller.acquire(timeout=0.01)
+        controller.release()
+
+        assert controller.acquire(timeout=0.01) is True
+
+
+@pytest.mark.unit
+class TestServiceBusy:
+    """Test the busy path when no concurrency slot frees up"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Test client whose service never gets a concurrency slot"""
+        app = create_app("testing")
+        monkeypatch.setattr(routes._ppb_service.concurrency, "acquire", lambda timeout=None: False)
+        return app.test_client()
+
+    def test_service_raises_busy(self, service, monkeypatch):
+        """Test that an admission timeout raises ServiceBusyError"""
+        monkeypatch.setattr(service.concurrency, "acquire", lambda timeout=None: False)
+
+        with pytest.raises(ServiceBusyError):
+            service.verify_license_detailed("PT2025D05614", use_cache=False)
+
+    def test_verify_returns_503(self, client):
+        """Test that /verify answers 503 with Retry-After"""
+        response = client.post("/verify", json={"license_number": "PT2025D05614"})
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert response.get_json()["success"] is False
+
+    def test_verify_batch_fails_busy_entries_only(self, client):
+        """Test that /verify/batch reports busy licenses as failed results"""
+        numbers = ["PT2025D05614", "PT2024B01234"]
+
+        response = client.post("/verify/batch", json={"license_numbers": numbers})
+        body = response.get_json()
+
+        assert response.status_code == 200
+        assert body["count"] == 2
+        assert [r["license_number"] for r in body["results"]] == numbers
+        assert all(r["success"] is False for r in body["results"])
+        assert all("busy" in r["message"] for r in body["results"])
@@ -0,0 +1,159 @@
+"""
+Rate Limiter Tests
+Tests that PPB rate-limit headers pause the limiter (no portal access needed)
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from src.adapters import http
+from src.adapters.http import RateLimiter
+
+
+class FakeResponse:
+    """Stand-in for requests.Response carrying only headers"""
+
+    def __init__(self, headers):
+        self.headers = CaseInsensitiveDict(headers)
+
+
+def pause_seconds(limiter: RateLimiter) -> float:
+    """Seconds the limiter will hold callers back for"""
+    return limiter.reset_at - time.monotonic()
+
+
+@pytest.fixture
+def limiter():
+    """Rate limiter with no base delay so only header pauses matter"""
+    return RateLimiter(delay=0)
+
+
+@pytest.mark.unit
+class TestRetryAfter:
+    """Test Retry-After handling"""
+
+    def test_delta_seconds(self, limiter):
+        """Test Retry-After given in seconds"""
+        limiter.update_from_response(FakeResponse({"Retry-After": "30"}))
+
+        assert 29 < pause_seconds(limiter) <= 30
+
+    def test_http_date(self, limiter):
+        """Test Retry-After given as an HTTP date"""
+        retry_at = formatdate(time.time() + 60, usegmt=True)
+        limiter.update_from_response(FakeResponse({"Retry-After": retry_at}))
+
+        assert 55 < pause_seconds(limiter) <= 60
+
+    def test_malformed_value_ignored(self, limiter):
+        """Test that an unparseable Retry-After does not pause"""
+        limiter.update_from_response(FakeResponse({"Retry-After": "soon"}))
+
+        assert limiter.reset_at == 0.0
+
+    def test_pause_capped(self, limiter):
+        """Test that absurd pauses are capped at MAX_PAUSE"""
+        limiter.update_from_response(FakeResponse({"Retry-After": "86400"}))
+
+        assert pause_seconds(limiter) <= RateLimiter.MAX_PAUSE
+
+    def test_pause_never_shortened(self, limiter):
+        """Test that a shorter pause does not override a longer one"""
+        limiter.update_from_response(FakeResponse({"Retry-After": "30"}))
+        limiter.update_from_response(FakeResponse({"Retry-After": "5"}))
+
+        assert pause_seconds(limiter) > 25
+
+
+@pytest.mark.unit
+class TestRateLimitHeaders:
+    """Test X-RateLimit-* handling"""
+
+    def test_healthy_quota_records_without_pausing(self, limiter):
+        """Test that plenty of remaining quota only updates the counters"""
+        limiter.update_from_response(FakeResponse({
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": "50",
+            "X-RateLimit-Reset": "30"
+        }))
+
+        assert limiter.remaining == 50
+        assert limiter.limit == 100
+        assert limiter.reset_at == 0.0
+
+    def test_low_remaining_pauses_until_relative_reset(self, limiter):
+        """Test pausing when remaining quota reaches MIN_REMAINING"""
+        limiter.update_from_response(FakeResponse({
+            "X-RateLimit-Remaining": str(RateLimiter.MIN_REMAINING),
+            "X-RateLimit-Reset": "20"
+        }))
+
+        assert 19 < pause_seconds(limiter) <= 20
+
+    def test_low_ratio_pauses(self, limiter):
+        """Test pausing when remaining quota drops below MIN_REMAINING_RATIO"""
+        limiter.update_from_response(FakeResponse({
+            "X-RateLimit-Limit": "1000",
+            "X-RateLimit-Remaining": "50",
+            "X-RateLimit-Reset": "10"
+        }))
+
+        assert 9 < pause_seconds(limiter) <= 10
+
+    def test_epoch_reset(self, limiter):
+        """Test X-RateLimit-Reset given as a Unix timestamp"""
+        limiter.update_from_response(FakeResponse({
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 40)
+        }))
+
+        assert 38 < pause_seconds(limiter) <= 40
+
+    def test_low_remaining_without_reset_ignored(self, limiter):
+        """Test that a low quota without a reset time does not pause"""
+        limiter.update_from_response(FakeResponse({"X-RateLimit-Remaining": "0"}))
+
+        assert limiter.remaining == 0
+        assert limiter.reset_at == 0.0
+
+    def test_malformed_values_ignored(self, limiter):
+        """Test that non-numeric headers are ignored"""
+        limiter.update_from_response(FakeResponse({
+            "X-RateLimit-Limit": "lots",
+            "X-RateLimit-Remaining": "few",
+            "X-RateLimit-Reset": "later"
+        }))
+
+        assert limiter.remaining is None
+        assert limiter.limit is None
+        assert limiter.reset_at == 0.0
+
+
+@pytest.mark.unit
+class TestWait:
+    """Test that wait() honours header pauses and the base delay"""
+
+    def test_wait_sleeps_through_pause(self, limiter, monkeypatch):
+        """Test that callers sleep until the server's reset time"""
+        sleeps = []
+        monkeypatch.setattr(http.time, "sleep", sleeps.append)
+        limiter.update_from_response(FakeResponse({"Retry-After": "10"}))
+
+        limiter.wait()
+
+        assert len(sleeps) == 1
+        assert 9 < sleeps[0] <= 10
+
+    def test_wait_spaces_requests_by_delay(self, monkeypatch):
+        """Test that consecutive callers are spaced at least `delay` apart"""
+        sleeps = []
+        monkeypatch.setattr(http.time, "sleep", sleeps.append)
+        limiter = RateLimiter(delay=1.5)
+
+        limiter.wait()
+        limiter.wait()
+
+        assert sleeps == [pytest.approx(1.5, abs=0.1)]